@@ -2,7 +2,17 @@
 
 import { useEffect, useState } from 'react';
 import { checkinService } from '../../services/checkin';
-import type { Checkin } from '../../../../website-frontend/app/models/checkin';
+import type { Checkin, LinkCheck } from '../../../../website-frontend/app/models/checkin';
+
+const LINK_STATUS_STYLES: Record<LinkCheck['status'], string> = {
+  pending: 'bg-slate-100 text-slate-600',
+  ok: 'bg-green-50 text-green-700',
+  private: 'bg-amber-50 text-amber-700',
+  broken: 'bg-red-50 text-red-700',
+  error: 'bg-red-50 text-red-700',
+  unreachable: 'bg-orange-50 text-orange-700',
+  invalid: 'bg-red-50 text-red-700',
+};
 
 interface Props {
   teamId: string;
@@ -11,6 +21,7 @@ interface Props {
 
 export default function CheckinsModal({ teamId, onClose }: Props) {
   const [checkins, setCheckins] = useState<Checkin[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
 
@@ -19,8 +30,9 @@ export default function CheckinsModal({ teamId, onClose }: Props) {
       setLoading(true);
       setError(null);
       try {
-        const items = await checkinService.listTeamCheckins(teamId);
-        setCheckins(items || []);
+        const page = await checkinService.listTeamCheckins(teamId);
+        setCheckins(page.checkins || []);
+        setNextCursor(page.nextCursor);
       } catch (err: unknown) {
         console.error('Failed to load checkins', err);
         const msg = err instanceof Error ? err.message : String(err);
@@ -31,6 +43,18 @@ export default function CheckinsModal({ teamId, onClose }: Props) {
     })();
   }, [teamId]);
 
+  const handleLoadMore = async () => {
+    if (!nextCursor) return;
+    try {
+      const page = await checkinService.listTeamCheckins(teamId, nextCursor);
+      setCheckins((prev) => [...prev, ...page.checkins]);
+      setNextCursor(page.nextCursor);
+    } catch (err: unknown) {
+      console.error('Failed to load more checkins', err);
+      alert('Failed to load more checkins');
+    }
+  };
+
   const handleDelete = async (id: string) => {
     const ok = confirm('Delete this checkin?');
     if (!ok) return;
@@ -111,24 +135,45 @@ export default function CheckinsModal({ teamId, onClose }: Props) {
                 </div>
                 
                 <div className="space-y-2">
-                  {c.links.map((l, idx) => (
-                    <a
-                      key={idx}
-                      href={l}
-                      target="_blank"
-                      rel="noopener noreferrer"
-                      className="flex items-center gap-2 text-sm text-blue-600 hover:text-blue-700 hover:bg-blue-50 p-2 rounded transition-colors group/link"
-                    >
-                      <svg className="w-4 h-4 shrink-0 opacity-60" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-                        <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M10 6H6a2 2 0 00-2 2v10a2 2 0 002 2h10a2 2 0 002-2v-4M14 4h6m0 0v6m0-6L10 14" />
-                      </svg>
-                      <span className="break-all group-hover/link:underline">{l}</span>
-                    </a>
-                  ))}
+                  {c.links.map((l, idx) => {
+                    const check = c.link_checks?.[idx];
+                    const status = check?.status ?? 'pending';
+                    return (
+                      <a
+                        key={idx}
+                        href={l}
+                        target="_blank"
+                        rel="noopener noreferrer"
+                        className="flex items-center gap-2 text-sm text-blue-600 hover:text-blue-700 hover:bg-blue-50 p-2 rounded transition-colors group/link"
+                      >
+                        <svg className="w-4 h-4 shrink-0 opacity-60" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                          <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M10 6H6a2 2 0 00-2 2v10a2 2 0 002 2h10a2 2 0 002-2v-4M14 4h6m0 0v6m0-6L10 14" />
+                        </svg>
+                        <span className="break-all group-hover/link:underline">{l}</span>
+                        <span
+                          className={`ml-auto shrink-0 text-xs font-medium px-2 py-0.5 rounded ${LINK_STATUS_STYLES[status]}`}
+                          title={check?.error ?? (check?.http_status ? `HTTP ${check.http_status}` : undefined)}
+                        >
+                          {status}
+                        </span>
+                      </a>
+                    );
+                  })}
                 </div>
               </div>
             ))}
           </div>
+
+          {nextCursor && (
+            <div className="text-center mt-4">
+              <button
+                onClick={handleLoadMore}
+                className="px-4 py-2 text-sm font-medium text-blue-900 border border-blue-900 rounded-lg hover:bg-blue-50 transition-colors"
+              >
+                Load older checkins
+              </button>
+            </div>
+          )}
         </div>
       </div>
     </div>
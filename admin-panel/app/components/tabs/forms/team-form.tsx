@@ -4,6 +4,7 @@ import { useState, useEffect, useRef } from 'react';
 import type { Team } from '../../../../../website-frontend/app/models/team';
 import type { Event } from '../../../../../website-frontend/app/models/event';
 import type { User } from '../../../../../website-frontend/app/models/user';
+import { userService } from '../../../services/user';
 
 interface TeamFormProps {
   team: Team | null;
@@ -11,10 +12,9 @@ interface TeamFormProps {
   onSave: (team: Partial<Team>) => void;
   onDelete?: (id: string) => void;
   availableEvents: Event[];
-  availableUsers: User[];
 }
 
-export default function TeamForm({ team, onClose, onSave, onDelete, availableEvents, availableUsers }: TeamFormProps) {
+export default function TeamForm({ team, onClose, onSave, onDelete, availableEvents }: TeamFormProps) {
   const [formData, setFormData] = useState<Partial<Team>>({
     teamNumber: '',
     conference: 'Regional',
@@ -25,6 +25,7 @@ export default function TeamForm({ team, onClose, onSave, onDelete, availableEve
   });
   const [memberSearch, setMemberSearch] = useState('');
   const [showMemberDropdown, setShowMemberDropdown] = useState(false);
+  const [searchResults, setSearchResults] = useState<User[]>([]);
   const [selectedMembers, setSelectedMembers] = useState<User[]>([]);
   const [selectedCaptain, setSelectedCaptain] = useState<User | null>(null);
   const overlayRef = useRef<HTMLDivElement | null>(null);
@@ -67,6 +68,28 @@ export default function TeamForm({ team, onClose, onSave, onDelete, availableEve
     return () => document.removeEventListener('mousedown', handleClickOutside);
   }, []);
 
+  // Search users on the server as the admin types (debounced)
+  useEffect(() => {
+    const q = memberSearch.trim();
+    if (!q) {
+      setSearchResults([]);
+      return;
+    }
+    let cancelled = false;
+    const timer = setTimeout(async () => {
+      try {
+        const page = await userService.searchUsers(q, 10);
+        if (!cancelled) setSearchResults(page.results);
+      } catch (err: unknown) {
+        console.error('User search failed', err);
+      }
+    }, 200);
+    return () => {
+      cancelled = true;
+      clearTimeout(timer);
+    };
+  }, [memberSearch]);
+
   const handleChange = (e: React.ChangeEvent<HTMLInputElement | HTMLSelectElement>) => {
     const { name, value } = e.target;
     if (name === 'eventId') {
@@ -104,10 +127,7 @@ export default function TeamForm({ team, onClose, onSave, onDelete, availableEve
     setFormData((prev) => ({ ...prev, captain: user }));
   };
 
-  const filteredUsers = availableUsers.filter(user => 
-    user.name?.toLowerCase().includes(memberSearch.toLowerCase()) &&
-    !selectedMembers.find(m => m.id === user.id)
-  );
+  const filteredUsers = searchResults.filter(user => !selectedMembers.find(m => m.id === user.id));
 
   const handleSubmit = (e: React.FormEvent) => {
     e.preventDefault();
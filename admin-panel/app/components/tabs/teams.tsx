@@ -4,16 +4,13 @@ import { useState, useEffect } from 'react';
 import TeamForm from './forms/team-form';
 import CheckinsModal from './checkins-modal';
 import { eventService } from '../../services/event';
-import { userService } from '../../services/user';
 import { teamService } from '../../services/team';
 import type { Team } from '../../../../website-frontend/app/models/team';
 import type { Event } from '../../../../website-frontend/app/models/event';
-import type { User } from '../../../../website-frontend/app/models/user';
 
 export default function TeamsTab() {
   const [teams, setTeams] = useState<Team[]>([]);
   const [availableEvents, setAvailableEvents] = useState<Event[]>([]);
-  const [availableUsers, setAvailableUsers] = useState<User[]>([]);
   const [searchQuery, setSearchQuery] = useState('');
   const [selectedEventFilter, setSelectedEventFilter] = useState('All');
   // conference filtering removed per user request
@@ -28,15 +25,13 @@ export default function TeamsTab() {
     setLoading(true);
     setError(null);
     try {
-      // Load teams, events, and users from API
-      const [teamsResp, eventsResp, usersResp] = await Promise.all([
+      // Load teams and events from API; the member picker searches users itself
+      const [teamsResp, eventsResp] = await Promise.all([
         teamService.listTeams().catch(() => [] as Team[]),
         eventService.listEvents().catch(() => [] as Event[]),
-        userService.listUsers().catch(() => [] as User[]),
       ]);
       setTeams(teamsResp || []);
       setAvailableEvents(eventsResp || []);
-      setAvailableUsers(usersResp || []);
     } catch (err: unknown) {
       console.error('Error loading teams', err);
       const msg = err instanceof Error ? err.message : String(err);
@@ -250,7 +245,6 @@ export default function TeamsTab() {
           onSave={handleSave} 
           onDelete={handleDelete}
           availableEvents={availableEvents}
-          availableUsers={availableUsers}
         />
       )}
 
@@ -4,8 +4,11 @@ import { useEffect, useState } from 'react';
 import type { User } from '../../../../website-frontend/app/models/user';
 import { userService } from '../../services/user';
 
+const PAGE_SIZE = 50;
+
 export default function UsersTab() {
   const [users, setUsers] = useState<User[]>([]);
+  const [totalUsers, setTotalUsers] = useState(0);
   const [whitelist, setWhitelist] = useState<string[]>([]);
   const [newEmails, setNewEmails] = useState('');
   const [searchQuery, setSearchQuery] = useState('');
@@ -15,14 +18,11 @@ export default function UsersTab() {
     let mounted = true;
     async function load() {
       try {
-        const [u, w] = await Promise.all([userService.listUsers(), userService.listWhitelist()]);
+        const w = await userService.listWhitelist();
         if (!mounted) return;
-        setUsers(u || []);
         setWhitelist(w || []);
       } catch (err: unknown) {
-        console.error('Failed to load users/whitelist', err);
-      } finally {
-        setLoading(false);
+        console.error('Failed to load whitelist', err);
       }
     }
     load();
@@ -31,9 +31,36 @@ export default function UsersTab() {
     };
   }, []);
 
-  const filteredUsers = users.filter((user) =>
-    (user.name || user.email).toLowerCase().includes(searchQuery.toLowerCase())
-  );
+  // Users are searched and paged on the server (debounced while typing)
+  useEffect(() => {
+    let cancelled = false;
+    const timer = setTimeout(async () => {
+      try {
+        const page = await userService.searchUsers(searchQuery.trim(), PAGE_SIZE);
+        if (cancelled) return;
+        setUsers(page.results);
+        setTotalUsers(page.total);
+      } catch (err: unknown) {
+        console.error('Failed to search users', err);
+      } finally {
+        if (!cancelled) setLoading(false);
+      }
+    }, 200);
+    return () => {
+      cancelled = true;
+      clearTimeout(timer);
+    };
+  }, [searchQuery]);
+
+  const handleLoadMore = async () => {
+    try {
+      const page = await userService.searchUsers(searchQuery.trim(), PAGE_SIZE, users.length);
+      setUsers((prev) => [...prev, ...page.results]);
+      setTotalUsers(page.total);
+    } catch (err: unknown) {
+      console.error('Failed to load more users', err);
+    }
+  };
 
   const handleAddToWhitelist = async () => {
     const emails = newEmails
@@ -88,7 +115,7 @@ export default function UsersTab() {
               </tr>
             </thead>
             <tbody className="divide-y divide-gray-200">
-              {filteredUsers.map((user) => (
+              {users.map((user) => (
                 <tr key={user.id} className="hover:bg-gray-50">
                   <td className="px-4 py-3 text-sm text-gray-900">{user.name || '-'}</td>
                   <td className="px-4 py-3 text-sm text-gray-600">{user.email}</td>
@@ -98,9 +125,17 @@ export default function UsersTab() {
           </table>
         </div>
 
-        {filteredUsers.length === 0 && (
+        {users.length === 0 && (
           <div className="text-center py-8 text-gray-500">No users found matching your search.</div>
         )}
+
+        {users.length > 0 && users.length < totalUsers && (
+          <div className="text-center mt-4">
+            <button onClick={handleLoadMore} className="px-4 py-2 text-sm font-medium text-blue-900 border border-blue-900 rounded-lg hover:bg-blue-50 transition-colors">
+              Load more ({users.length} of {totalUsers})
+            </button>
+          </div>
+        )}
       </div>
 
       <div className="bg-white rounded-lg shadow p-6">
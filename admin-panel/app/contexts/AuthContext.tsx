@@ -9,7 +9,7 @@ interface AuthContextType {
   isAuthenticated: boolean;
   isLoading: boolean;
   login: (password: string) => Promise<void>;
-  logout: () => void;
+  logout: () => Promise<void>;
 }
 
 const AuthContext = createContext<AuthContextType | undefined>(undefined);
@@ -34,8 +34,8 @@ export function AuthProvider({ children }: { children: ReactNode }) {
     setToken(adminToken);
   };
 
-  const logout = () => {
-    authService.removeToken();
+  const logout = async () => {
+    await authService.logout();
     setToken(null);
     router.push('/login');
   };
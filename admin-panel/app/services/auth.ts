@@ -39,6 +39,18 @@ class AuthService {
     return data.admin_token;
   }
 
+  // Revokes the token server-side; local state is cleared even if the request fails
+  async logout(): Promise<void> {
+    const token = this.getToken();
+    if (token) {
+      await fetch(`${API_BASE_URL}/auth/logout`, {
+        method: 'POST',
+        headers: { 'X-Admin-Token': token },
+      }).catch(() => undefined);
+    }
+    this.removeToken();
+  }
+
   saveToken(token: string): void {
     localStorage.setItem(this.TOKEN_KEY, token);
   }
@@ -11,10 +11,13 @@ class CheckinService {
     return CheckinService.instance;
   }
 
-  async listTeamCheckins(teamId: string): Promise<Checkin[]> {
-    const res = await fetch(`${API_BASE_URL}/teams/${teamId}/checkins`);
+  // One page, newest first; pass nextCursor back as `before` for older checkins
+  async listTeamCheckins(teamId: string, before?: string): Promise<{ checkins: Checkin[]; nextCursor: string | null }> {
+    const url = new URL(`${API_BASE_URL}/teams/${teamId}/checkins`);
+    if (before) url.searchParams.set('before', before);
+    const res = await fetch(url.toString());
     if (!res.ok) throw new Error(`Failed to fetch checkins: ${res.statusText}`);
-    return res.json();
+    return { checkins: await res.json(), nextCursor: res.headers.get('X-Next-Cursor') };
   }
 
   async deleteCheckin(checkinId: string): Promise<void> {
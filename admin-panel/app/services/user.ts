@@ -1,5 +1,6 @@
 import { authService } from './auth';
 import type { User } from '../../../website-frontend/app/models/user';
+import type { SearchPage, UserSearchResult, TeamSearchResult } from '../../../website-frontend/app/models/search';
 
 const API_BASE_URL = process.env.NEXT_PUBLIC_API_BASE_URL;
 
@@ -15,6 +16,17 @@ class UserService {
     return authService.makeAuthenticatedRequest<{ users: User[] }>('/auth/users').then((r) => r.users || []);
   }
 
+  // Ranked, paginated server-side search; an empty query lists everyone by name
+  async searchUsers(q: string, limit = 20, offset = 0): Promise<SearchPage<UserSearchResult>> {
+    const params = new URLSearchParams({ q, limit: String(limit), offset: String(offset) });
+    return authService.makeAuthenticatedRequest<SearchPage<UserSearchResult>>(`/search/users?${params}`);
+  }
+
+  async searchTeams(q: string, limit = 20, offset = 0): Promise<SearchPage<TeamSearchResult>> {
+    const params = new URLSearchParams({ q, limit: String(limit), offset: String(offset) });
+    return authService.makeAuthenticatedRequest<SearchPage<TeamSearchResult>>(`/search/teams?${params}`);
+  }
+
   async listWhitelist(): Promise<string[]> {
     return authService.makeAuthenticatedRequest<{ whitelist: string[] }>('/auth/whitelist').then((r) => r.whitelist || []);
   }
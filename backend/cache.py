@@ -0,0 +1,300 @@
+import asyncio
+import json
+import os
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Awaitable, Callable, Optional, TypeVar, get_type_hints
+
+from dotenv import load_dotenv
+from pydantic import TypeAdapter
+
+from logs import get_logger
+
+load_dotenv()
+
+logger = get_logger("cache")
+
+# Config
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory")  # "memory" or "redis"
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+CACHE_PREFIX = os.getenv("CACHE_PREFIX", "tsahub")
+CACHE_TTL_SECONDS = float(os.getenv("CACHE_TTL_SECONDS", "30"))
+# Per-process entry limit for the in-process backend; least recently used go first
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "10000"))
+
+T = TypeVar("T")
+Listener = Callable[[Optional[str]], None]
+
+MISS = object()
+
+# Callbacks for invalidations published by *other* workers, keyed by namespace.
+# A worker updates its own in-process state directly when it writes.
+_listeners: dict[str, list[Listener]] = {}
+
+
+def on_invalidate(namespace: str, listener: Listener) -> None:
+    """Register a callback for invalidations of `namespace` coming from other workers."""
+    _listeners.setdefault(namespace, []).append(listener)
+
+
+def _notify(namespace: str, data: Optional[str]) -> None:
+    for listener in _listeners.get(namespace, []):
+        try:
+            listener(data)
+        except Exception as e:
+            logger.error("Error handling cache invalidation", extra={"namespace": namespace, "error": str(e)})
+
+
+class CacheBackend(ABC):
+    """Namespaced cache with versioned keys.
+
+    Invalidating a namespace bumps its version, so entries written by reads that
+    started before the invalidation land under the old version and are never seen.
+    """
+
+    # Whether values must be JSON-encodable (shared stores) or can be kept as objects
+    serializes = False
+
+    async def start(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    @abstractmethod
+    async def version(self, namespace: str) -> int:
+        ...
+
+    @abstractmethod
+    async def get(self, namespace: str, version: int, key: str) -> Any:
+        """Return the cached value or MISS."""
+
+    @abstractmethod
+    async def set(self, namespace: str, version: int, key: str, value: Any, ttl: float) -> None:
+        ...
+
+    @abstractmethod
+    async def invalidate(self, namespace: str, data: Optional[str] = None) -> None:
+        ...
+
+    # Expiring sets: unversioned state that must outlive invalidations and reach
+    # workers started later (e.g. revoked tokens). Per-process backends keep none.
+    async def expiring_set_add(self, name: str, member: str, expires_at: float) -> None:
+        """Add `member` to the shared set `name` until `expires_at` (unix time)."""
+
+    async def expiring_set_members(self, name: str) -> dict[str, float]:
+        """Unexpired members of the shared set `name`, with their expiry times."""
+        return {}
+
+
+class InProcessCache(CacheBackend):
+    """Per-process cache. Correct only when the API runs as a single worker."""
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES) -> None:
+        self._versions: dict[str, int] = {}
+        self._entries: "OrderedDict[tuple[str, int, str], tuple[float, Any]]" = OrderedDict()
+        self._max_entries = max_entries
+
+    async def version(self, namespace: str) -> int:
+        return self._versions.get(namespace, 0)
+
+    async def get(self, namespace: str, version: int, key: str) -> Any:
+        entry = self._entries.get((namespace, version, key))
+        if entry is None:
+            return MISS
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop((namespace, version, key), None)
+            return MISS
+        self._entries.move_to_end((namespace, version, key))
+        return value
+
+    async def set(self, namespace: str, version: int, key: str, value: Any, ttl: float) -> None:
+        if version != self._versions.get(namespace, 0):
+            return
+        self._entries[(namespace, version, key)] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end((namespace, version, key))
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    async def invalidate(self, namespace: str, data: Optional[str] = None) -> None:
+        self._versions[namespace] = self._versions.get(namespace, 0) + 1
+        for entry_key in [k for k in self._entries if k[0] == namespace]:
+            del self._entries[entry_key]
+
+
+class RedisCache(CacheBackend):
+    """Cache shared by every worker through a Redis-protocol store.
+
+    `client` is a `redis.asyncio.Redis` or anything exposing the same async
+    get/set/incr/publish/pubsub and sorted-set calls (e.g. fakeredis in tests).
+    Namespace versions are kept locally and refreshed from the invalidation
+    channel; entry TTLs bound staleness if a message is ever missed.
+    """
+
+    serializes = True
+
+    def __init__(self, client: Any, prefix: str = CACHE_PREFIX) -> None:
+        self._client = client
+        self._prefix = prefix
+        self._channel = f"{prefix}:invalidate"
+        self._worker_id = uuid.uuid4().hex
+        self._versions: dict[str, int] = {}
+        self._pubsub: Any = None
+        self._task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_url(cls, url: str = REDIS_URL) -> "RedisCache":
+        # Imported lazily so single-worker deployments don't need redis installed
+        import redis.asyncio as redis
+
+        return cls(redis.from_url(url, decode_responses=True))
+
+    def _version_key(self, namespace: str) -> str:
+        return f"{self._prefix}:version:{namespace}"
+
+    def _entry_key(self, namespace: str, version: int, key: str) -> str:
+        return f"{self._prefix}:{namespace}:v{version}:{key}"
+
+    def _set_key(self, name: str) -> str:
+        return f"{self._prefix}:set:{name}"
+
+    async def start(self) -> None:
+        self._pubsub = self._client.pubsub()
+        await self._pubsub.subscribe(self._channel)
+        self._task = asyncio.create_task(self._listen())
+
+    async def close(self) -> None:
+        if self._task:
+            self._task.cancel()
+        if self._pubsub is not None:
+            await self._pubsub.unsubscribe(self._channel)
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async for message in self._pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    payload = json.loads(message["data"])
+                    namespace = payload["namespace"]
+                    self._versions[namespace] = max(self._versions.get(namespace, 0), payload["version"])
+                    if payload["origin"] != self._worker_id:
+                        _notify(namespace, payload.get("data"))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Cache invalidation listener error", extra={"error": str(e)})
+                # Messages may have been lost; re-read versions from the store
+                self._versions.clear()
+                await asyncio.sleep(1)
+
+    async def version(self, namespace: str) -> int:
+        v = self._versions.get(namespace)
+        if v is None:
+            v = int(await self._client.get(self._version_key(namespace)) or 0)
+            self._versions[namespace] = v
+        return v
+
+    async def get(self, namespace: str, version: int, key: str) -> Any:
+        raw = await self._client.get(self._entry_key(namespace, version, key))
+        return MISS if raw is None else json.loads(raw)
+
+    async def set(self, namespace: str, version: int, key: str, value: Any, ttl: float) -> None:
+        await self._client.set(self._entry_key(namespace, version, key), json.dumps(value), px=int(ttl * 1000))
+
+    async def expiring_set_add(self, name: str, member: str, expires_at: float) -> None:
+        # Sorted set scored by expiry; expired members are trimmed on every access
+        key = self._set_key(name)
+        await self._client.zremrangebyscore(key, "-inf", time.time())
+        await self._client.zadd(key, {member: expires_at})
+
+    async def expiring_set_members(self, name: str) -> dict[str, float]:
+        key = self._set_key(name)
+        now = time.time()
+        await self._client.zremrangebyscore(key, "-inf", now)
+        return {m: float(score) for m, score in await self._client.zrangebyscore(key, now, "+inf", withscores=True)}
+
+    async def invalidate(self, namespace: str, data: Optional[str] = None) -> None:
+        v = int(await self._client.incr(self._version_key(namespace)))
+        self._versions[namespace] = v
+        await self._client.publish(self._channel, json.dumps({
+            "namespace": namespace,
+            "version": v,
+            "origin": self._worker_id,
+            "data": data,
+        }))
+
+
+def create_backend() -> CacheBackend:
+    if CACHE_BACKEND == "redis":
+        return RedisCache.from_url(REDIS_URL)
+    return InProcessCache()
+
+
+_backend: CacheBackend = create_backend()
+
+
+def get_backend() -> CacheBackend:
+    return _backend
+
+
+def set_backend(backend: CacheBackend) -> None:
+    global _backend
+    _backend = backend
+
+
+async def invalidate(*namespaces: str, data: Optional[str] = None) -> None:
+    """Invalidate namespaces on this worker and broadcast to the others.
+
+    Errors are logged rather than raised: a write that already succeeded should
+    not fail because the cache is unreachable; TTLs bound the staleness.
+    """
+    for namespace in namespaces:
+        try:
+            await _backend.invalidate(namespace, data)
+        except Exception as e:
+            logger.error("Error invalidating cache namespace", extra={"namespace": namespace, "error": str(e)})
+
+
+def cached(namespace: str, ttl: Optional[float] = None) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Cache an async read function's result under `namespace`.
+
+    Falsy results (None, []) are not cached: a lookup for a row that doesn't exist
+    yet (a user mid-signup, say) would otherwise be answered "missing" until the
+    invalidation reached this worker, and arbitrary unknown ids could fill the
+    cache. Place it above @single_flight so cache misses are coalesced.
+    """
+
+    def decorator(fn: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        adapter = TypeAdapter(get_type_hints(fn)["return"])
+        name = fn.__name__
+
+        @wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            backend = _backend
+            key = f"{name}:{args!r}:{sorted(kwargs.items())!r}"
+            try:
+                version = await backend.version(namespace)
+                hit = await backend.get(namespace, version, key)
+            except Exception as e:
+                logger.warning("Cache read failed", extra={"namespace": namespace, "key": key, "error": str(e)})
+                return await fn(*args, **kwargs)
+            if hit is not MISS:
+                return adapter.validate_python(hit) if backend.serializes else hit
+
+            result = await fn(*args, **kwargs)
+            if result:
+                value = adapter.dump_python(result, mode="json", by_alias=True) if backend.serializes else result
+                try:
+                    await backend.set(namespace, version, key, value, ttl or CACHE_TTL_SECONDS)
+                except Exception as e:
+                    logger.warning("Cache write failed", extra={"namespace": namespace, "key": key, "error": str(e)})
+            return result
+
+        return wrapper
+
+    return decorator
@@ -1,134 +1,310 @@
+import asyncio
+import base64
+import json
+import time
+import uuid
 from datetime import datetime
 from typing import Optional, Union, Any
 from pydantic import BaseModel as PydanticBaseModel
 from fastapi import HTTPException
 from supabase import create_client, Client
+from supabase.lib.client_options import ClientOptions
+from postgrest import APIResponse
+from postgrest.exceptions import APIError
 import os
 from dotenv import load_dotenv
 
 from models.team import Team
 from models.user import User
 from models.event import Event
-from models.checkin import Checkin
+from models.checkin import Checkin, CheckinImport, CheckinPage, CheckinSummary
+from models.search import SearchPage, UserSearchResult, TeamSearchResult
+import team_index
+from singleflight import single_flight
+from cache import cached, invalidate, on_invalidate
+import snapshots
+from logs import get_logger
+from resilience import CircuitBreaker, CircuitOpenError, DatabaseUnavailable, call_with_deadline, last_good, SUPABASE_WRITE_TIMEOUT_S
 
 load_dotenv()
 
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_ANON_KEY")
+# Rows per multi-row insert in create_checkins_bulk
+CHECKIN_INSERT_CHUNK = int(os.getenv("CHECKIN_INSERT_CHUNK", "500"))
 
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+# The HTTP timeout frees worker threads abandoned at the per-operation deadline
+supabase: Client = create_client(
+    SUPABASE_URL,
+    SUPABASE_KEY,
+    options=ClientOptions(postgrest_client_timeout=SUPABASE_WRITE_TIMEOUT_S),
+)
 
+
+logger = get_logger("database")
+
+_OPERATIONS = {"GET": "select", "POST": "insert", "PATCH": "update", "DELETE": "delete"}
+
+# Shared by every Supabase call in this process
+breaker = CircuitBreaker()
+
+
+class QueryError(Exception):
+    """A failed Supabase request, carrying the table, operation and duration for logging."""
+
+    def __init__(self, table: str, operation: str, duration_ms: float, error: Exception):
+        super().__init__(str(error))
+        self.table = table
+        self.operation = operation
+        self.duration_ms = duration_ms
+
+
+class UnavailableQueryError(QueryError, DatabaseUnavailable):
+    """A QueryError caused by an outage (breaker open, deadline, transient error) rather than the request."""
+
+
+def _log_error(message: str, e: Exception, **fields: Any) -> None:
+    fields["error"] = str(e)
+    if isinstance(e, QueryError):
+        fields.update(table=e.table, operation=e.operation, duration_ms=round(e.duration_ms, 1))
+    logger.error(message, extra=fields)
+
+
+def _write_error(message: str, e: Exception, note: str = "", **fields: Any) -> HTTPException:
+    """Log a failed write and return the HTTPException to raise for it.
+
+    An outage gets the same 503 as the reads, without internal error text.
+    """
+    if isinstance(e, HTTPException):
+        return e
+    _log_error(message, e, **fields)
+    if isinstance(e, DatabaseUnavailable):
+        return HTTPException(status_code=503, detail=f"Database temporarily unavailable{note}")
+    return HTTPException(status_code=500, detail=f"Database error{note}: {str(e)}")
+
+
+def _is_transient(e: Exception) -> bool:
+    # PostgREST errors carry a Postgres SQLSTATE (constraint violations, bad
+    # input, ...) that retrying won't fix; an HTTP status code means a gateway
+    # error. Connection and resource classes (08, 53, 57, 58) are transient.
+    if isinstance(e, APIError):
+        code = str(e.code or "")
+        return code.isdigit() and len(code) == 3 or code[:2] in ("08", "53", "57", "58")
+    return True
+
+
+def _is_invalid_input(e: Exception) -> bool:
+    # SQLSTATE class 22 (data exceptions: a malformed uuid, timestamp, ...) and
+    # PostgREST's PGRST1xx request errors: the request itself can't be answered
+    if isinstance(e, APIError):
+        code = str(e.code or "")
+        return code.startswith("22") or code.startswith("PGRST1")
+    return False
+
+
+async def _execute(query, idempotent: Optional[bool] = None):
+    # supabase-py is synchronous; run requests off the event loop so concurrent
+    # requests actually overlap (and can be coalesced by single_flight), under a
+    # deadline and the circuit breaker. Only reads are retried; pass
+    # idempotent=True for read-only RPCs, which are POSTs.
+    table = getattr(query, "path", "").lstrip("/")
+    if table.startswith("rpc/"):
+        operation = "rpc"
+    else:
+        operation = _OPERATIONS.get(getattr(query, "http_method", ""), "query")
+    if idempotent is None:
+        idempotent = operation == "select"
+    start = time.perf_counter()
+    try:
+        response = await call_with_deadline(
+            query.execute,
+            idempotent=idempotent,
+            breaker=breaker,
+            is_transient=_is_transient,
+        )
+    except Exception as e:
+        if idempotent and _is_invalid_input(e):
+            # A read with malformed input (e.g. a non-uuid id) can't match any row
+            return APIResponse(data=[], count=None)
+        outage = isinstance(e, (CircuitOpenError, asyncio.TimeoutError)) or _is_transient(e)
+        error_cls = UnavailableQueryError if outage else QueryError
+        raise error_cls(table, operation, (time.perf_counter() - start) * 1000, e) from e
+    logger.debug("Supabase query", extra={
+        "table": table,
+        "operation": operation,
+        "duration_ms": round((time.perf_counter() - start) * 1000, 1),
+    })
+    return response
+
+
+async def ping(timeout_s: float) -> float:
+    """One cheap round trip for the readiness probe; returns its latency in ms.
+
+    Deliberately single-shot and outside the circuit breaker, so probing neither
+    retries nor moves breaker state.
+    """
+    start = time.perf_counter()
+    await asyncio.wait_for(asyncio.to_thread(supabase.table("events").select("id").limit(1).execute), timeout_s)
+    return (time.perf_counter() - start) * 1000
+
+
+# Writes on other workers: memberships may have changed (team id or event
+# deletion), or hydrated teams embed a stale user/event
+on_invalidate("teams", lambda data: team_index.reset() if data else None)
+on_invalidate("users", lambda data: team_index.drop_teams_with_user(data) if data else None)
+on_invalidate("events", lambda data: team_index.drop_teams_with_event(data) if data else None)
+
+
+@last_good
+@single_flight
 async def get_user_by_google_id(google_id: str) -> Optional[User]:
     try:
-        response = supabase.table("users").select("*").eq("google_id", google_id).execute()
+        response = await _execute(supabase.table("users").select("*").eq("google_id", google_id))
         if response.data:
             return User(**response.data[0])
         return None
     except Exception as e:
-        print(f"Error fetching user by Google ID: {e}")
-        return None
+        _log_error("Error fetching user by Google ID", e)
+        raise
 
+@last_good
+@cached("users")
+@single_flight
 async def get_user_by_id(user_id: str) -> Optional[User]:
     try:
-        response = supabase.table("users").select("*").eq("id", user_id).execute()
+        response = await _execute(supabase.table("users").select("*").eq("id", user_id))
         if response.data:
             return User(**response.data[0])
         return None
     except Exception as e:
-        print(f"Error fetching user by ID: {e}")
-        return None
+        _log_error("Error fetching user by ID", e)
+        raise
 
 async def create_user(user_data: dict) -> User:
     try:
         user_data["created_at"] = datetime.utcnow().isoformat()
         user_data["updated_at"] = datetime.utcnow().isoformat()
 
-        response = supabase.table("users").insert(user_data).execute()
+        response = await _execute(supabase.table("users").insert(user_data))
         if response.data:
             return User(**response.data[0])
         else:
             raise HTTPException(status_code=500, detail="Failed to create user")
     except Exception as e:
-        print(f"Error creating user: {e}")
-        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+        raise _write_error("Error creating user", e)
 
 async def update_user(user_id: str, user_data: dict) -> User:
     try:
         user_data["updated_at"] = datetime.utcnow().isoformat()
 
-        response = supabase.table("users").update(user_data).eq("id", user_id).execute()
+        response = await _execute(supabase.table("users").update(user_data).eq("id", user_id))
         if response.data:
+            team_index.drop_teams_with_user(user_id)
+            views = await _execute(supabase.table("team_views").select("team_id").contains("user_ids", [user_id]))
+            team_ids = [v["team_id"] for v in views.data or []]
+            if team_ids:
+                await _refresh_team_views(team_ids=team_ids)
+            await invalidate("users", data=user_id)
+            await invalidate("teams")
             return User(**response.data[0])
         else:
             raise HTTPException(status_code=404, detail="User not found")
     except Exception as e:
-        print(f"Error updating user: {e}")
-        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+        raise _write_error("Error updating user", e)
 
 async def create_event(event_data: dict) -> Event:
     try:
-        response = supabase.table("events").insert(event_data).execute()
+        response = await _execute(supabase.table("events").insert(event_data))
         if response.data:
+            await invalidate("events")
+            await publish_event_catalog()
             return Event(**response.data[0])
         else:
             raise HTTPException(status_code=500, detail="Failed to create event")
     except Exception as e:
-        print(f"Error creating event: {e}")
-        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+        raise _write_error("Error creating event", e)
 
 
 async def update_event(event_id: str, event_data: dict) -> Event:
     try:
-        response = supabase.table("events").update(event_data).eq("id", event_id).execute()
+        response = await _execute(supabase.table("events").update(event_data).eq("id", event_id))
         if response.data:
+            team_index.drop_teams_with_event(event_id)
+            await _refresh_team_views(event_id=event_id)
+            await invalidate("events", data=event_id)
+            await invalidate("teams")
+            await publish_event_catalog()
             return Event(**response.data[0])
         else:
             raise HTTPException(status_code=404, detail="Event not found")
     except Exception as e:
-        print(f"Error updating event: {e}")
-        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+        raise _write_error("Error updating event", e)
 
 
 async def delete_event(event_id: str) -> bool:
     try:
-        response = supabase.table("events").delete().eq("id", event_id).execute()
+        response = await _execute(supabase.table("events").delete().eq("id", event_id))
+        # Deleting an event cascades to its teams, so rebuild the index lazily
+        team_index.reset()
+        await invalidate("events")
+        await invalidate("teams", data=f"event:{event_id}")
+        if response.data:
+            await publish_event_catalog()
         # Supabase returns data for deleted rows; if none, treat as not found
         return bool(response.data)
     except Exception as e:
-        print(f"Error deleting event: {e}")
-        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+        raise _write_error("Error deleting event", e)
 
+@last_good
+@cached("events")
+@single_flight
 async def get_event_by_id(event_id: str) -> Optional[Event]:
     try:
-        response = supabase.table("events").select("*").eq("id", event_id).execute()
+        response = await _execute(supabase.table("events").select("*").eq("id", event_id))
         if response.data:
             return Event(**response.data[0])
         return None
     except Exception as e:
-        print(f"Error fetching event: {e}")
-        return None
+        _log_error("Error fetching event", e)
+        raise
+
+async def fetch_events() -> list[Event]:
+    """Uncached, uncoalesced event list. Raises on database errors."""
+    # Fetch events and sort case-insensitively so 'A' and 'a' both appear at top
+    response = await _execute(supabase.table("events").select("*"))
+    rows = response.data or []
+    rows.sort(key=lambda r: (r.get("title") or "").lower())
+    return [Event(**e) for e in rows]
 
+
+@last_good
+@cached("events")
+@single_flight
 async def list_events() -> list[Event]:
     try:
-        # Fetch events and sort case-insensitively so 'A' and 'a' both appear at top
-        response = supabase.table("events").select("*").execute()
-        if not response.data:
-            return []
-        rows = response.data
-        rows.sort(key=lambda r: (r.get("title") or "").lower())
-        return [Event(**e) for e in rows]
+        return await fetch_events()
+    except Exception as e:
+        _log_error("Error listing events", e)
+        raise
+
+
+async def publish_event_catalog() -> None:
+    # Re-render the static catalog (at startup and after event writes); never raises
+    try:
+        await snapshots.publish_event_catalog(fetch_events)
     except Exception as e:
-        print(f"Error listing events: {e}")
-        return []
+        _log_error("Error publishing event catalog snapshot", e)
 
 
+@last_good
+@single_flight
 async def list_users() -> list[User]:
     try:
-        response = supabase.table("users").select("*").order("created_at", desc=False).execute()
+        response = await _execute(supabase.table("users").select("*").order("created_at", desc=False))
         return [r for r in response.data] if response.data else []
     except Exception as e:
-        print(f"Error listing users: {e}")
-        return []
+        _log_error("Error listing users", e)
+        raise
     
 async def create_team(team_data: Union[dict, PydanticBaseModel]) -> Team:
     """
@@ -169,13 +345,13 @@ async def create_team(team_data: Union[dict, PydanticBaseModel]) -> Team:
         if not conference:
             raise HTTPException(status_code=400, detail="Missing conference")
 
-        response = supabase.table("teams").insert({
+        response = await _execute(supabase.table("teams").insert({
             "event_id": event_id,
             "team_number": team_number,
             "conference": conference,
             "captain_id": captain_id,
             "check_in_date": check_in_date
-        }).execute()
+        }))
 
         if not response.data:
             raise HTTPException(status_code=500, detail="Failed to create team")
@@ -186,70 +362,135 @@ async def create_team(team_data: Union[dict, PydanticBaseModel]) -> Team:
         # Insert members
         member_ids = member_ids or []
         for uid in member_ids:
-            supabase.table("team_members").insert({
+            await _execute(supabase.table("team_members").insert({
                 "team_id": team_id,
                 "user_id": uid
-            }).execute()
-
-        # Return hydrated team
-        return await get_team_by_id(team_id)
+            }))
+        team_index.set_team_users(team_id, [captain_id] + member_ids)
+        team = await _refresh_team_view(team_id)
+        await invalidate("teams", data=team_id)
+        return team
 
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error creating team: {e}")
-        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+        raise _write_error("Error creating team", e)
 
 
-async def get_team_by_id(team_id: str) -> Optional[Team]:
+# Teams are stored denormalized in team_views, one JSON document per team with
+# its event, captain and members embedded, and every team read is a single-table
+# read of that. Only the write paths rebuild documents, through refresh_team_views.
+
+
+def _team_from_view(row: dict) -> Team:
+    return Team.model_validate(row["document"])
+
+
+def _hydrate_team_rows(rows: list[dict], read_generation: int) -> list[Team]:
+    teams = []
+    for row in rows:
+        try:
+            team = _team_from_view(row)
+        except Exception as e:
+            _log_error("Error hydrating team", e, team_id=row.get("team_id"))
+            continue
+        team_index.put_team(team, read_generation)
+        teams.append(team)
+    return teams
+
+
+async def _refresh_team_views(team_ids: Optional[list[str]] = None, event_id: Optional[str] = None) -> list[Team]:
+    """Rebuild the views of the given teams (or an event's teams; every team when
+    neither is given) from the normalized tables and return them.
+
+    The rebuild runs in Postgres (refresh_team_views in migrations.sql), which
+    locks the teams rows before reading: concurrent refreshes of a team run one
+    after the other and the last one reads every write committed before it, so
+    an older document can't land last.
+    """
+    gen = team_index.generation()
+    response = await _execute(supabase.rpc("refresh_team_views", {"team_ids": team_ids, "for_event": event_id}))
+    return _hydrate_team_rows(response.data or [], gen)
+
+
+async def _refresh_team_view(team_id: str) -> Optional[Team]:
+    teams = await _refresh_team_views(team_ids=[team_id])
+    if not teams:
+        team_index.remove_team(team_id)
+        return None
+    return teams[0]
+
+
+async def rebuild_team_views() -> int:
+    """Rewrite every team's view from the normalized tables (backfill or repair)."""
     try:
-        # Base team row
-        team_res = supabase.table("teams").select("*").eq("id", team_id).execute()
+        team_index.reset()
+        teams = await _refresh_team_views()
+        await invalidate("teams")
+        return len(teams)
+    except Exception as e:
+        raise _write_error("Error rebuilding team views", e)
+
+
+async def backfill_team_views() -> None:
+    """Write views for teams that have none (first deploy, or teams written
+    outside this module). Run once at startup so reads stay single-table; never raises.
+    """
+    try:
+        teams, views = await asyncio.gather(
+            _execute(supabase.table("teams").select("id")),
+            _execute(supabase.table("team_views").select("team_id")),
+        )
+        missing = list({r["id"] for r in teams.data or []} - {r["team_id"] for r in views.data or []})
+        if not missing:
+            return
+        logger.warning("Team views missing, rebuilding from teams", extra={"team_ids": missing})
+        await _refresh_team_views(team_ids=missing)
+        await invalidate("teams")
+    except Exception as e:
+        _log_error("Error backfilling team views", e)
+
+
+async def _load_team(team_id: str) -> Optional[Team]:
+    # Uncoalesced read used by the write paths, which must not join a read that
+    # started before their write landed
+    try:
+        gen = team_index.generation()
+        team_res = await _execute(supabase.table("team_views").select("team_id, document").eq("team_id", team_id))
         if not team_res.data:
+            team_index.remove_team(team_id)
             return None
-        team_row = team_res.data[0]
-
-        # Event
-        event = await get_event_by_id(team_row["event_id"])
-
-        # Captain
-        captain = await get_user_by_id(team_row["captain_id"])
-
-        # Members
-        member_links = supabase.table("team_members").select("*").eq("team_id", team_id).execute()
-        members = []
-        for ml in member_links.data:
-            u = await get_user_by_id(ml["user_id"])
-            if u:
-                members.append(u)
-
-        return Team(
-            id=team_row["id"],
-            event=event,
-            teamNumber=team_row["team_number"],
-            conference=team_row["conference"],
-            captain=captain,
-            members=members,
-            checkInDate=team_row.get("check_in_date")
-        )
+        teams = _hydrate_team_rows(team_res.data, gen)
+        return teams[0] if teams else None
     except Exception as e:
-        print(f"Error fetching team by ID: {e}")
-        return None
+        _log_error("Error fetching team by ID", e)
+        raise
 
 
-async def list_teams() -> list[Team]:
+@last_good
+@cached("teams")
+@single_flight
+async def get_team_by_id(team_id: str) -> Optional[Team]:
+    return await _load_team(team_id)
+
+
+@single_flight
+async def _load_all_teams() -> list[Team]:
     try:
-        response = supabase.table("teams").select("id").execute()
-        team_ids = [row["id"] for row in response.data] if response.data else []
-        teams = []
-        for tid in team_ids:
-            team = await get_team_by_id(tid)
-            if team:
-                teams.append(team)
+        gen = team_index.generation()
+        response = await _execute(supabase.table("team_views").select("team_id, document"))
+        teams = _hydrate_team_rows(response.data or [], gen)
+        team_index.mark_built(gen)
         return teams
     except Exception as e:
-        print(f"Error listing teams: {e}")
-        return []
+        _log_error("Error listing teams", e)
+        raise
+
+
+@last_good
+@cached("teams")
+async def list_teams() -> list[Team]:
+    return await _load_all_teams()
 
 
 async def update_team(team_id: str, team_data: Union[dict, PydanticBaseModel]) -> Team:
@@ -298,36 +539,40 @@ async def update_team(team_id: str, team_data: Union[dict, PydanticBaseModel]) -
 
         if not update_payload and member_ids is None:
             # Nothing to update
-            return await get_team_by_id(team_id)
+            return await _load_team(team_id)
 
         if update_payload:
-            response = supabase.table("teams").update(update_payload).eq("id", team_id).execute()
+            response = await _execute(supabase.table("teams").update(update_payload).eq("id", team_id))
             if not response.data:
                 raise HTTPException(status_code=404, detail="Team not found")
 
         # Optionally update members: remove and re-insert
         if member_ids is not None:
-            supabase.table("team_members").delete().eq("team_id", team_id).execute()
+            await _execute(supabase.table("team_members").delete().eq("team_id", team_id))
             for uid in member_ids:
-                supabase.table("team_members").insert({"team_id": team_id, "user_id": uid}).execute()
+                await _execute(supabase.table("team_members").insert({"team_id": team_id, "user_id": uid}))
 
-        return await get_team_by_id(team_id)
+        # Forget the old membership before re-hydrating so a failed read can't leave it stale
+        team_index.remove_team(team_id)
+        team = await _refresh_team_view(team_id)
+        await invalidate("teams", data=team_id)
+        return team
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error updating team: {e}")
-        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+        raise _write_error("Error updating team", e)
 
 
 async def delete_team(team_id: str) -> bool:
     try:
         # Delete team members first
-        supabase.table("team_members").delete().eq("team_id", team_id).execute()
-        response = supabase.table("teams").delete().eq("id", team_id).execute()
+        await _execute(supabase.table("team_members").delete().eq("team_id", team_id))
+        response = await _execute(supabase.table("teams").delete().eq("id", team_id))
+        team_index.remove_team(team_id)
+        await invalidate("teams", data=team_id)
         return bool(response.data)
     except Exception as e:
-        print(f"Error deleting team: {e}")
-        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+        raise _write_error("Error deleting team", e)
 
 
 async def create_checkin(team_id: str, checkin_data: Union[dict, PydanticBaseModel]) -> Checkin:
@@ -349,124 +594,291 @@ async def create_checkin(team_id: str, checkin_data: Union[dict, PydanticBaseMod
             # let DB default submitted_at/created_at if present
         }
 
-        response = supabase.table("checkins").insert(payload).execute()
+        response = await _execute(supabase.table("checkins").insert(payload))
         if not response.data:
             raise HTTPException(status_code=500, detail="Failed to create checkin")
 
-        row = response.data[0]
-        return await get_checkin_by_id(row["id"])
+        # The insert returns the stored row (with DB defaults); no need to read it back
+        await invalidate("checkins")
+        return _checkin_from_row(response.data[0])
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error creating checkin: {e}")
-        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+        raise _write_error("Error creating checkin", e)
+
 
+async def create_checkins_bulk(items: list[CheckinImport]) -> list[Checkin]:
+    """Insert many checkins (backfills, imports) in chunked multi-row inserts.
 
-async def get_checkins_by_team(team_id: str) -> list[Checkin]:
+    Chunks are committed as they go: on failure the error says how many
+    checkins were stored, and those are the first ones in `items` order.
+    """
+    if any(not item.links for item in items):
+        raise HTTPException(status_code=400, detail="Every checkin needs a non-empty `links` list")
+    team_ids = sorted({item.team_id for item in items})
     try:
-        response = supabase.table("checkins").select("*").eq("team_id", team_id).order("created_at", desc=True).execute()
-        if not response.data:
-            return []
-        checkins = []
-        for r in response.data:
-            checkins.append(Checkin(
-                id=r["id"],
-                team_id=r["team_id"],
-                submitted_at=r.get("submitted_at") or r.get("created_at"),
-                links=r.get("links", []),
-                created_at=r.get("created_at")
-            ))
-        return checkins
-    except Exception as e:
-        print(f"Error fetching checkins for team {team_id}: {e}")
-        return []
+        found = await _execute(supabase.table("teams").select("id").in_("id", team_ids))
+    except Exception as e:
+        raise _write_error("Error validating checkin teams", e)
+    unknown = set(team_ids) - {row["id"] for row in found.data or []}
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown team ids: {', '.join(sorted(unknown))}")
+
+    # Every row in a multi-row insert must carry the same columns, so checkins
+    # without a submitted_at get the import time instead of the column default.
+    # Imported ones keep their original order (lists sort by created_at).
+    now = datetime.utcnow().isoformat()
+    rows = []
+    for item in items:
+        submitted_at = item.submitted_at.isoformat() if item.submitted_at else now
+        rows.append({"team_id": item.team_id, "links": item.links, "submitted_at": submitted_at, "created_at": submitted_at})
+
+    checkins: list[Checkin] = []
+    try:
+        for start in range(0, len(rows), CHECKIN_INSERT_CHUNK):
+            response = await _execute(supabase.table("checkins").insert(rows[start:start + CHECKIN_INSERT_CHUNK]))
+            checkins.extend(_checkin_from_row(r) for r in response.data or [])
+    except Exception as e:
+        raise _write_error(
+            "Error bulk inserting checkins", e,
+            note=f" after storing {len(checkins)} of {len(rows)} checkins", inserted=len(checkins), total=len(rows),
+        )
+    finally:
+        if checkins:
+            await invalidate("checkins")
+    return checkins
 
 
+def _checkin_from_row(r: dict) -> Checkin:
+    return Checkin(
+        id=r["id"],
+        team_id=r["team_id"],
+        submitted_at=r.get("submitted_at") or r.get("created_at"),
+        links=r.get("links", []),
+        created_at=r.get("created_at"),
+        link_checks=r.get("link_checks") or []
+    )
+
+
+def _encode_cursor(row: dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps([row["created_at"], row["id"]]).encode()).decode()
+
+
+def _is_uuid(value: str) -> bool:
+    try:
+        uuid.UUID(value)
+        return True
+    except ValueError:
+        return False
+
+
+def _decode_cursor(cursor: str) -> tuple[str, str]:
+    # Checked here: a malformed id or timestamp would otherwise fail in Postgres
+    # (22P02) and surface as a 503 and a circuit-breaker failure
+    try:
+        created_at, checkin_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        datetime.fromisoformat(created_at)
+        if _is_uuid(checkin_id):
+            return created_at, checkin_id
+    except Exception:
+        pass
+    raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+@last_good
+@cached("checkins")
+@single_flight
+async def get_checkins_by_team(team_id: str, limit: int = 50, before: Optional[str] = None) -> CheckinPage:
+    """One page of a team's checkins, newest first.
+
+    Keyset-paginated on (created_at, id) by the checkin_history function
+    (migrations.sql), so deep pages cost the same as the first.
+    """
+    if not _is_uuid(team_id):
+        raise HTTPException(status_code=400, detail="Invalid team id")
+    before_created_at, before_id = _decode_cursor(before) if before else (None, None)
+    try:
+        response = await _execute(supabase.rpc("checkin_history", {
+            "team": team_id,
+            "max_results": limit + 1,
+            "before_created_at": before_created_at,
+            "before_id": before_id,
+        }), idempotent=True)
+        rows = response.data or []
+        next_cursor = _encode_cursor(rows[limit - 1]) if len(rows) > limit else None
+        return CheckinPage(checkins=[_checkin_from_row(r) for r in rows[:limit]], next_cursor=next_cursor)
+    except Exception as e:
+        _log_error("Error fetching checkins for team", e, team_id=team_id)
+        raise
+
+
+@last_good
+@cached("checkins")
+@single_flight
+async def get_checkin_summaries() -> list[CheckinSummary]:
+    """Each team's latest checkin and checkin count, from the team_checkin_summary view."""
+    try:
+        response = await _execute(supabase.table("team_checkin_summary").select("*"))
+        return [
+            CheckinSummary(team_id=r["team_id"], checkin_count=r["checkin_count"], latest=_checkin_from_row(r))
+            for r in response.data or []
+        ]
+    except Exception as e:
+        _log_error("Error fetching checkin summaries", e)
+        raise
+
+
+@last_good
+@cached("checkins")
+@single_flight
 async def get_checkin_by_id(checkin_id: str) -> Optional[Checkin]:
     try:
-        response = supabase.table("checkins").select("*").eq("id", checkin_id).execute()
+        response = await _execute(supabase.table("checkins").select("*").eq("id", checkin_id))
         if not response.data:
             return None
-        r = response.data[0]
-        return Checkin(
-            id=r["id"],
-            team_id=r["team_id"],
-            submitted_at=r.get("submitted_at") or r.get("created_at"),
-            links=r.get("links", []),
-            created_at=r.get("created_at")
-        )
+        return _checkin_from_row(response.data[0])
     except Exception as e:
-        print(f"Error fetching checkin by ID: {e}")
-        return None
+        _log_error("Error fetching checkin by ID", e)
+        raise
 
 
 async def delete_checkin(checkin_id: str) -> bool:
     try:
-        response = supabase.table("checkins").delete().eq("id", checkin_id).execute()
+        response = await _execute(supabase.table("checkins").delete().eq("id", checkin_id))
+        await invalidate("checkins")
         return bool(response.data)
     except Exception as e:
-        print(f"Error deleting checkin: {e}")
-        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+        raise _write_error("Error deleting checkin", e)
+
+
+async def update_checkin_link_checks(checkin_id: str, link_checks: list[dict]) -> bool:
+    """Store the link validation results for a checkin (see link_checks.py)."""
+    try:
+        response = await _execute(supabase.table("checkins").update({"link_checks": link_checks}).eq("id", checkin_id))
+        await invalidate("checkins")
+        return bool(response.data)
+    except Exception as e:
+        _log_error("Error storing checkin link checks", e, checkin_id=checkin_id)
+        raise
+
+
+# Admin search, ranked in Postgres by search_users/search_teams (migrations.sql)
+@last_good
+async def search_users(query: str, limit: int = 20, offset: int = 0) -> SearchPage[UserSearchResult]:
+    try:
+        response = await _execute(
+            supabase.rpc("search_users", {"q": query, "max_results": limit, "skip": offset}),
+            idempotent=True,
+        )
+        # {"results": [...], "total": n}; total counts every match, not just this page
+        data = response.data or {}
+        return SearchPage[UserSearchResult](
+            results=[UserSearchResult(**r) for r in data.get("results") or []],
+            total=data.get("total", 0),
+            limit=limit,
+            offset=offset,
+        )
+    except Exception as e:
+        _log_error("Error searching users", e)
+        raise
+
+
+@last_good
+async def search_teams(query: str, limit: int = 20, offset: int = 0) -> SearchPage[TeamSearchResult]:
+    try:
+        response = await _execute(
+            supabase.rpc("search_teams", {"q": query, "max_results": limit, "skip": offset}),
+            idempotent=True,
+        )
+        data = response.data or {}
+        return SearchPage[TeamSearchResult](
+            results=[TeamSearchResult(**r) for r in data.get("results") or []],
+            total=data.get("total", 0),
+            limit=limit,
+            offset=offset,
+        )
+    except Exception as e:
+        _log_error("Error searching teams", e)
+        raise
 
 
 # Whitelist helpers
+# No @last_good: an authorization check fails closed rather than serving a
+# remembered answer for an email that may have been removed since.
+@single_flight
 async def is_email_whitelisted(email: str) -> bool:
     try:
-        response = supabase.table("whitelist").select("email").eq("email", email.lower()).execute()
+        response = await _execute(supabase.table("whitelist").select("email").eq("email", email.lower()))
         return bool(response.data)
     except Exception as e:
-        print(f"Error checking whitelist for {email}: {e}")
-        return False
+        _log_error("Error checking whitelist", e, email=email)
+        raise HTTPException(status_code=503, detail="Database temporarily unavailable")
 
 
+@last_good
+@single_flight
 async def list_whitelist() -> list[str]:
     try:
-        response = supabase.table("whitelist").select("email").order("added_at", desc=False).execute()
+        response = await _execute(supabase.table("whitelist").select("email").order("added_at", desc=False))
         return [row["email"] for row in response.data] if response.data else []
     except Exception as e:
-        print(f"Error listing whitelist: {e}")
-        return []
+        _log_error("Error listing whitelist", e)
+        raise
 
 
 async def add_whitelist_email(email: str) -> bool:
     try:
         row = {"email": email.lower()}
-        response = supabase.table("whitelist").insert(row).execute()
+        response = await _execute(supabase.table("whitelist").insert(row))
         return bool(response.data)
     except Exception as e:
-        print(f"Error adding to whitelist: {e}")
+        _log_error("Error adding to whitelist", e)
         return False
 
 
 async def remove_whitelist_email(email: str) -> bool:
     try:
-        response = supabase.table("whitelist").delete().eq("email", email.lower()).execute()
+        response = await _execute(supabase.table("whitelist").delete().eq("email", email.lower()))
         return True
     except Exception as e:
-        print(f"Error removing from whitelist: {e}")
+        _log_error("Error removing from whitelist", e)
         return False
 
 
+@last_good
+@single_flight
 async def list_user_teams(user_id: str) -> list[Team]:
     """
-    Get all teams where user is a captain or a member
+    Get all teams where user is a captain or a member.
+
+    Team ids come from the in-memory index in team_index; a cold index is filled
+    by a single teams query. Teams already hydrated are served from memory
+    and the rest are fetched together in one query.
     """
     try:
-        # Teams where user is captain
-        captain_res = supabase.table("teams").select("id").eq("captain_id", user_id).execute()
-        captain_team_ids = [r["id"] for r in captain_res.data] if captain_res.data else []
-
-        # Teams where user is a member
-        member_res = supabase.table("team_members").select("team_id").eq("user_id", user_id).execute()
-        member_team_ids = [r["team_id"] for r in member_res.data] if member_res.data else []
+        team_ids = team_index.team_ids_for_user(user_id)
+        if team_ids is None:
+            # The load builds the index, unless a write raced it; answer from the rows either way
+            all_teams = await _load_all_teams()
+            return [t for t in all_teams if t.captain.id == user_id or any(m.id == user_id for m in t.members)]
 
-        all_ids = set(captain_team_ids + member_team_ids)
         teams = []
-        for tid in all_ids:
-            team = await get_team_by_id(tid)
+        missing = []
+        for tid in team_ids:
+            team = team_index.get_cached_team(tid)
             if team:
                 teams.append(team)
+            else:
+                missing.append(tid)
+
+        if missing:
+            gen = team_index.generation()
+            response = await _execute(supabase.table("team_views").select("team_id, document").in_("team_id", missing))
+            found = response.data or []
+            teams.extend(_hydrate_team_rows(found, gen))
+            for tid in set(missing) - {row["team_id"] for row in found}:
+                team_index.remove_team(tid)
         return teams
     except Exception as e:
-        print(f"Error listing user teams: {e}")
-        return []
+        _log_error("Error listing user teams", e)
+        raise
@@ -0,0 +1,291 @@
+import asyncio
+import ipaddress
+import os
+import re
+import socket
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import AsyncIterator, NamedTuple, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+import httpcore
+import httpx
+from dotenv import load_dotenv
+
+import database
+from logs import get_logger
+from models.checkin import LinkCheck
+
+load_dotenv()
+
+# Background validation of check-in links. POST /teams/{team_id}/checkins only
+# queues the new check-in; worker tasks check its links concurrently and store
+# one LinkCheck per link on the check-in (`link_checks`, empty until checked).
+
+# Config
+LINK_CHECK_WORKERS = int(os.getenv("LINK_CHECK_WORKERS", "4"))
+LINK_CHECK_CONCURRENCY = int(os.getenv("LINK_CHECK_CONCURRENCY", "16"))
+LINK_CHECK_PER_HOST = int(os.getenv("LINK_CHECK_PER_HOST", "4"))
+LINK_CHECK_TIMEOUT_S = float(os.getenv("LINK_CHECK_TIMEOUT_S", "5"))
+LINK_CHECK_QUEUE_SIZE = int(os.getenv("LINK_CHECK_QUEUE_SIZE", "1000"))
+LINK_CHECK_CACHE_TTL_S = float(os.getenv("LINK_CHECK_CACHE_TTL_S", "600"))
+LINK_CHECK_CACHE_MAX = int(os.getenv("LINK_CHECK_CACHE_MAX", "5000"))
+
+logger = get_logger("link_checks")
+
+# A scheme other than a bare "host:port" (mailto:, javascript:, ...)
+_SCHEME_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]*:(?!\d)")
+
+# Hosts whose sign-in page means the document exists but isn't shared publicly
+LOGIN_HOSTS = {"accounts.google.com", "login.microsoftonline.com", "login.live.com"}
+
+
+class FetchResult(NamedTuple):
+    status_code: int
+    url: str  # after redirects
+
+
+class BlockedAddressError(Exception):
+    """The link resolves to a loopback, private or otherwise non-public address."""
+
+
+class _PublicAddressBackend(httpcore.AsyncNetworkBackend):
+    # Resolves once per connection, refuses non-public addresses and connects to
+    # the address it checked, so a rebinding DNS record can't swap in another
+    def __init__(self) -> None:
+        self._backend = httpcore.AnyIOBackend()
+
+    async def connect_tcp(self, host: str, port: int, timeout: Optional[float] = None, local_address: Optional[str] = None, **kwargs):
+        infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        addresses = [info[4][0] for info in infos]
+        if not addresses or not all(ipaddress.ip_address(a).is_global for a in addresses):
+            raise BlockedAddressError(f"{host} resolves to a non-public address")
+        return await self._backend.connect_tcp(addresses[0], port, timeout=timeout, local_address=local_address, **kwargs)
+
+    async def connect_unix_socket(self, path: str, timeout: Optional[float] = None, **kwargs):
+        raise BlockedAddressError("unix sockets are not allowed")
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+class PublicAddressTransport(httpx.AsyncHTTPTransport):
+    """Transport that only connects to public addresses, for every redirect hop.
+
+    The URL, Host header and TLS server name keep the original hostname; only
+    the TCP connection is pinned to the address that passed the check.
+    """
+
+    def __init__(self, limits: httpx.Limits) -> None:
+        super().__init__(limits=limits)
+        # AsyncHTTPTransport takes no network backend, so rebuild its pool with ours
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=httpx.create_ssl_context(),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            network_backend=_PublicAddressBackend(),
+        )
+
+
+class LinkFetcher(ABC):
+    async def close(self) -> None:
+        pass
+
+    @abstractmethod
+    async def fetch(self, url: str) -> FetchResult:
+        """Request `url`, following redirects, without reading the body."""
+
+
+class HttpxFetcher(LinkFetcher):
+    """Fetches links over HTTP with a shared connection pool.
+
+    Pass `transport` to point it at a local stand-in (e.g. httpx.MockTransport).
+    Otherwise links to loopback and private addresses are refused unless
+    `block_private=False`.
+    """
+
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None, block_private: bool = True):
+        self.transport = transport
+        self.block_private = block_private
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is not None:
+            return self._client
+        limits = httpx.Limits(max_connections=LINK_CHECK_CONCURRENCY)
+        transport = self.transport
+        if transport is None and self.block_private:
+            transport = PublicAddressTransport(limits)
+        self._client = httpx.AsyncClient(
+            transport=transport,
+            follow_redirects=True,
+            max_redirects=5,
+            timeout=LINK_CHECK_TIMEOUT_S,
+            limits=limits,
+            headers={"User-Agent": "NCSSM-TSA-Hub link checker"},
+        )
+        return self._client
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def fetch(self, url: str) -> FetchResult:
+        async with self._get_client().stream("GET", url) as response:
+            return FetchResult(response.status_code, str(response.url))
+
+
+_fetcher: LinkFetcher = HttpxFetcher()
+
+
+def get_fetcher() -> LinkFetcher:
+    return _fetcher
+
+
+def set_fetcher(fetcher: LinkFetcher) -> None:
+    global _fetcher
+    _fetcher = fetcher
+
+
+def normalize_url(url: str) -> Optional[str]:
+    """Canonical form used for fetching and as the cache key; None if it isn't an http(s) URL."""
+    url = url.strip()
+    if "://" not in url:
+        if _SCHEME_RE.match(url):
+            return None
+        url = f"https://{url}"
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return None
+    scheme = parts.scheme.lower()
+    if scheme not in ("http", "https") or not parts.hostname:
+        return None
+    host = parts.hostname.lower()
+    if port is not None and port != (443 if scheme == "https" else 80):
+        host = f"{host}:{port}"
+    return urlunsplit((scheme, host, parts.path or "/", parts.query, ""))
+
+
+def classify(result: FetchResult) -> str:
+    if urlsplit(result.url).hostname in LOGIN_HOSTS or result.status_code in (401, 403):
+        return "private"
+    if 200 <= result.status_code < 300:
+        return "ok"
+    if result.status_code in (404, 410):
+        return "broken"
+    return "error"
+
+
+# Result cache keyed by normalized URL: url -> (expires_at, LinkCheck)
+_results: "OrderedDict[str, tuple[float, LinkCheck]]" = OrderedDict()
+_inflight: dict[str, "asyncio.Task[LinkCheck]"] = {}
+# host -> [semaphore, holders]; dropped once no check holds or waits on it
+_host_slots: dict[str, list] = {}
+_fetch_slots = asyncio.Semaphore(LINK_CHECK_CONCURRENCY)
+
+
+@asynccontextmanager
+async def _host_slot(host: str) -> AsyncIterator[None]:
+    slot = _host_slots.setdefault(host, [asyncio.Semaphore(LINK_CHECK_PER_HOST), 0])
+    slot[1] += 1
+    try:
+        async with slot[0]:
+            yield
+    finally:
+        slot[1] -= 1
+        if not slot[1]:
+            _host_slots.pop(host, None)
+
+
+async def _fetch(url: str) -> LinkCheck:
+    check = LinkCheck(url=url)
+    try:
+        # Host slot first: links queued behind a busy host must not hold global slots
+        async with _host_slot(urlsplit(url).netloc), _fetch_slots:
+            result = await asyncio.wait_for(_fetcher.fetch(url), LINK_CHECK_TIMEOUT_S * 2)
+        check.status = classify(result)
+        check.http_status = result.status_code
+    except BlockedAddressError as e:
+        check.status, check.error = "invalid", str(e)
+    except (asyncio.TimeoutError, httpx.TimeoutException):
+        check.status, check.error = "unreachable", "timed out"
+    except Exception as e:
+        check.status, check.error = "unreachable", str(e) or type(e).__name__
+    check.checked_at = datetime.utcnow()
+    # Unreachable is often transient; check again next time
+    if check.status != "unreachable":
+        _results[url] = (time.monotonic() + LINK_CHECK_CACHE_TTL_S, check)
+        _results.move_to_end(url)
+        while len(_results) > LINK_CHECK_CACHE_MAX:
+            _results.popitem(last=False)
+    return check
+
+
+async def check_url(url: str) -> LinkCheck:
+    normalized = normalize_url(url)
+    if normalized is None:
+        return LinkCheck(url=url.strip(), status="invalid", error="not an http(s) URL", checked_at=datetime.utcnow())
+    hit = _results.get(normalized)
+    if hit is not None and hit[0] > time.monotonic():
+        return hit[1]
+    # Concurrent checks of the same URL share one fetch
+    task = _inflight.get(normalized)
+    if task is None:
+        task = _inflight[normalized] = asyncio.create_task(_fetch(normalized))
+        task.add_done_callback(lambda _: _inflight.pop(normalized, None))
+    return await asyncio.shield(task)
+
+
+_queue: Optional[asyncio.Queue] = None
+_workers: list[asyncio.Task] = []
+
+
+async def _worker() -> None:
+    while True:
+        checkin_id, links = await _queue.get()
+        try:
+            checks = await asyncio.gather(*(check_url(link) for link in links))
+            await database.update_checkin_link_checks(checkin_id, [c.model_dump(mode="json") for c in checks])
+            broken = [c.url for c in checks if c.status != "ok"]
+            if broken:
+                logger.info("Check-in has unusable links", extra={"checkin_id": checkin_id, "links": broken})
+        except Exception as e:
+            logger.error("Error checking check-in links", extra={"checkin_id": checkin_id, "error": str(e)})
+        finally:
+            _queue.task_done()
+
+
+def start() -> None:
+    global _queue
+    if _workers:
+        return
+    _queue = asyncio.Queue(maxsize=LINK_CHECK_QUEUE_SIZE)
+    _workers.extend(asyncio.create_task(_worker()) for _ in range(LINK_CHECK_WORKERS))
+
+
+async def stop() -> None:
+    for task in _workers:
+        task.cancel()
+    await asyncio.gather(*_workers, return_exceptions=True)
+    _workers.clear()
+    await _fetcher.close()
+
+
+def submit(checkin_id: str, links: list[str]) -> None:
+    """Queue a stored check-in for link validation. Never blocks the caller.
+
+    When the queue is full the check-in is skipped and its links stay unchecked.
+    """
+    # Started by main.py; this covers callers that skip the startup hook
+    start()
+    try:
+        _queue.put_nowait((checkin_id, links))
+    except asyncio.QueueFull:
+        logger.warning("Link check queue full, skipping check-in", extra={"checkin_id": checkin_id})
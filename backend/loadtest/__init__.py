@@ -0,0 +1,8 @@
+"""Competition-day load test for the API.
+
+Replays the login -> /teams/me -> check-in spike against the FastAPI app
+in-process, with Supabase and Google OAuth replaced by local stand-ins.
+Run from the backend directory:
+
+    python -m loadtest --users 600 --teams 200 --window 120
+"""
@@ -0,0 +1,61 @@
+import argparse
+import asyncio
+import json
+from dataclasses import asdict
+from typing import Optional
+
+from loadtest.report import format_report, summarize
+from loadtest.scenario import ScenarioConfig, run_scenario
+
+
+def parse_args() -> tuple[ScenarioConfig, Optional[str]]:
+    defaults = ScenarioConfig()
+    parser = argparse.ArgumentParser(prog="python -m loadtest", description="Competition-day load test")
+    parser.add_argument("--users", type=int, default=defaults.users, help="students logging in")
+    parser.add_argument("--teams", type=int, default=defaults.teams, help="teams the students are dealt onto")
+    parser.add_argument("--events", type=int, default=defaults.events)
+    parser.add_argument("--window", type=float, default=defaults.window_s, help="seconds over which arrivals are spread")
+    parser.add_argument("--rate", type=float, default=None, help="arrivals per second (overrides --window)")
+    parser.add_argument("--think-ms", type=float, default=defaults.think_ms, help="mean pause between a student's requests")
+    parser.add_argument("--checkins-per-user", type=int, default=defaults.checkins_per_user)
+    parser.add_argument("--db-latency-ms", type=float, default=defaults.db_latency_ms, help="simulated Supabase round trip")
+    parser.add_argument("--db-jitter-ms", type=float, default=defaults.db_jitter_ms)
+    parser.add_argument("--oauth-latency-ms", type=float, default=defaults.oauth_latency_ms, help="simulated Google call latency")
+    parser.add_argument("--link-latency-ms", type=float, default=defaults.link_latency_ms, help="simulated check-in link fetch latency")
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--json", dest="json_path", default=None, help="also write per-endpoint stats to this file")
+    args = parser.parse_args()
+    cfg = ScenarioConfig(
+        users=args.users,
+        teams=args.teams,
+        events=args.events,
+        window_s=args.window,
+        rate=args.rate,
+        think_ms=args.think_ms,
+        checkins_per_user=args.checkins_per_user,
+        db_latency_ms=args.db_latency_ms,
+        db_jitter_ms=args.db_jitter_ms,
+        oauth_latency_ms=args.oauth_latency_ms,
+        link_latency_ms=args.link_latency_ms,
+        seed=args.seed,
+    )
+    return cfg, args.json_path
+
+
+def main() -> None:
+    cfg, json_path = parse_args()
+    recorder, duration, db = asyncio.run(run_scenario(cfg))
+    stats = summarize(recorder)
+    print(format_report(stats, recorder, duration, db.queries))
+    if json_path:
+        with open(json_path, "w") as f:
+            json.dump({
+                "config": asdict(cfg),
+                "duration_s": duration,
+                "database_queries": db.queries,
+                "endpoints": [dict(asdict(s), error_rate=s.error_rate) for s in stats],
+            }, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
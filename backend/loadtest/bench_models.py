@@ -0,0 +1,141 @@
+"""CPU cost of building and rendering team lists from database rows.
+
+    python -m loadtest.bench_models --teams 1000 --members 5
+
+"fastapi":   models built with validation; FastAPI validates the return value
+             against response_model, dumps it and renders it with JSONResponse.
+"construct": models built with model_construct (no validation); trusted_response.
+"trusted":   models built with validation; trusted_response (what the routes do).
+"""
+import argparse
+import json
+import time
+from datetime import datetime
+from typing import Callable, List
+
+from fastapi.responses import JSONResponse
+from fastapi.utils import create_response_field
+
+import utils
+from models.event import Event
+from models.team import Team
+from models.user import User
+
+
+def make_rows(teams: int, members: int) -> list[dict]:
+    """Team rows with the event, captain and members embedded."""
+
+    def user(n: int) -> dict:
+        return {
+            "id": f"user-{n}",
+            "email": f"student{n}@ncssm.edu",
+            "name": f"Student {n}",
+            "picture": f"https://example.com/avatar/{n}.png",
+            "google_id": f"google-{n}",
+            "created_at": "2025-01-01T00:00:00.000000+00:00",
+            "updated_at": "2025-02-01T12:30:00.000000+00:00",
+        }
+
+    out = []
+    for t in range(teams):
+        base = t * (members + 1)
+        out.append({
+            "id": f"team-{t}",
+            "team_number": f"2045-{t:04d}",
+            "conference": "NCTSA States",
+            "check_in_date": "2025-04-01T09:00:00+00:00",
+            "event": {
+                "id": f"event-{t % 40}",
+                "title": f"Event {t % 40}",
+                "theme": "Theme",
+                "full_theme_url": None,
+                "description": "Event description " * 8,
+                "category": "Design",
+                "team_size": "1-6",
+                "types": ["Team", "Semifinalist"],
+                "rubric_url": "https://example.com/rubric.pdf",
+            },
+            "captain": user(base),
+            "team_members": [{"user": user(base + m + 1)} for m in range(members)],
+        })
+    return out
+
+
+def build(row: dict, make: Callable) -> Team:
+    return make(Team, {
+        "id": row["id"],
+        "event": make(Event, row["event"]),
+        "teamNumber": row["team_number"],
+        "conference": row["conference"],
+        "captain": make(User, row["captain"]),
+        "members": [make(User, ml["user"]) for ml in row["team_members"]],
+        "checkInDate": row["check_in_date"],
+    })
+
+
+def validated(model, row: dict):
+    return model(**row)
+
+
+def constructed(model, row: dict):
+    # model_construct skips type coercion, so parse the datetime columns here
+    values = dict(row)
+    for key in ("created_at", "updated_at"):
+        if isinstance(values.get(key), str):
+            values[key] = datetime.fromisoformat(values[key])
+    return model.model_construct(**values)
+
+
+def fastapi_path(team_rows: list[dict], field) -> bytes:
+    teams = [build(r, validated) for r in team_rows]
+    # What fastapi.routing.serialize_response does for a response_model
+    value, errors = field.validate(teams, {}, loc=("response",))
+    assert not errors
+    return JSONResponse(field.serialize(value, mode="json", by_alias=True)).body
+
+
+def construct_path(team_rows: list[dict], field) -> bytes:
+    teams = [build(r, constructed) for r in team_rows]
+    return utils.trusted_response(teams, List[Team]).body
+
+
+def trusted_path(team_rows: list[dict], field) -> bytes:
+    teams = [build(r, validated) for r in team_rows]
+    return utils.trusted_response(teams, List[Team]).body
+
+
+def cpu_ms(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.process_time()
+        fn()
+        best = min(best, time.process_time() - start)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m loadtest.bench_models")
+    parser.add_argument("--teams", type=int, default=1000)
+    parser.add_argument("--members", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    utils.STRICT_MODELS = False
+    team_rows = make_rows(args.teams, args.members)
+    field = create_response_field(name="response", type_=List[Team])
+    paths = {"fastapi": fastapi_path, "construct": construct_path, "trusted": trusted_path}
+
+    expected = json.loads(fastapi_path(team_rows, field))
+    for name, path in paths.items():
+        assert json.loads(path(team_rows, field)) == expected, f"{name} output differs"
+
+    per_1000 = 1000 / args.teams
+    print(f"{args.teams} teams x {args.members + 1} users, best of {args.repeat} (CPU ms)")
+    baseline = None
+    for name, path in paths.items():
+        ms = cpu_ms(lambda: path(team_rows, field), args.repeat)
+        baseline = baseline or ms
+        print(f"  {name:<10} {ms:8.1f} ms  ({ms * per_1000:6.1f} per 1,000 teams, {ms / baseline:.2f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,344 @@
+import copy
+import random
+import re
+import threading
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+# Local stand-in for the supabase-py client used by database.py.
+# Supports the query-builder calls the backend makes (select/insert/upsert/
+# update/delete, eq/in_/contains/order/limit/range, PostgREST resource
+# embedding, and the RPCs and views from migrations.sql) over in-memory
+# tables, with an optional simulated round-trip latency. execute() blocks like
+# the real client, so it exercises the same worker threads.
+
+
+def _now() -> str:
+    return datetime.utcnow().isoformat()
+
+
+def _uuid() -> str:
+    return str(uuid.uuid4())
+
+
+# Column defaults applied on insert, mirroring migrations.sql
+TABLE_DEFAULTS: dict[str, dict[str, Callable[[], Any]]] = {
+    "users": {"id": _uuid, "created_at": _now, "updated_at": _now},
+    "teams": {"id": _uuid},
+    "checkins": {"id": _uuid, "submitted_at": _now, "created_at": _now, "link_checks": list},
+    "whitelist": {"added_at": _now},
+    "team_views": {"updated_at": _now},
+}
+
+# (table, embedded table) -> (local column, remote column, to-many)
+RELATIONS: dict[tuple[str, str], tuple[str, str, bool]] = {
+    ("teams", "events"): ("event_id", "id", False),
+    ("teams", "users"): ("captain_id", "id", False),
+    ("teams", "team_members"): ("id", "team_id", True),
+    ("teams", "checkins"): ("id", "team_id", True),
+    ("team_members", "users"): ("user_id", "id", False),
+    ("team_members", "teams"): ("team_id", "id", False),
+    ("checkins", "teams"): ("team_id", "id", False),
+}
+
+# ON DELETE CASCADE edges: table -> [(child table, child column, parent column)]
+CASCADES: dict[str, list[tuple[str, str, str]]] = {
+    "events": [("teams", "event_id", "id")],
+    "teams": [("team_members", "team_id", "id"), ("checkins", "team_id", "id"), ("team_views", "team_id", "id")],
+    "users": [("teams", "captain_id", "id"), ("team_members", "user_id", "id")],
+}
+
+_EMBED_RE = re.compile(r"^(?:(\w+):)?(\w+)(?:!(\w+))?\((.*)\)$", re.S)
+
+
+def _split_top_level(columns: str) -> list[str]:
+    items, depth, current = [], 0, ""
+    for ch in columns:
+        if ch == "," and depth == 0:
+            items.append(current.strip())
+            current = ""
+            continue
+        depth += ch == "("
+        depth -= ch == ")"
+        current += ch
+    if current.strip():
+        items.append(current.strip())
+    return items
+
+
+class FakeResponse:
+    def __init__(self, data: Any, count: Optional[int] = None):
+        self.data = data
+        self.count = count
+
+
+class FakeQuery:
+    def __init__(self, db: "FakeSupabase", table: str):
+        self._db = db
+        self._table = table
+        # Same attributes as postgrest's request builders, read by database._execute
+        self.path = f"/{table}"
+        self.http_method = "GET"
+        self._op = "select"
+        self._columns = "*"
+        self._payload: Any = None
+        self._filters: list[Callable[[dict], bool]] = []
+        self._order: list[tuple[str, bool]] = []
+        self._offset = 0
+        self._limit: Optional[int] = None
+        self._count = False
+        self._on_conflict: Optional[str] = None
+
+    # Operations
+    def select(self, columns: str = "*", count: Optional[str] = None) -> "FakeQuery":
+        self._columns = columns
+        self._count = count is not None
+        return self
+
+    def insert(self, payload: Any) -> "FakeQuery":
+        self._op, self._payload = "insert", payload
+        self.http_method = "POST"
+        return self
+
+    def upsert(self, payload: Any, on_conflict: str = "") -> "FakeQuery":
+        self._op, self._payload = "insert", payload
+        self._on_conflict = on_conflict or "id"
+        self.http_method = "POST"
+        return self
+
+    def update(self, payload: dict) -> "FakeQuery":
+        self._op, self._payload = "update", payload
+        self.http_method = "PATCH"
+        return self
+
+    def delete(self) -> "FakeQuery":
+        self._op = "delete"
+        self.http_method = "DELETE"
+        return self
+
+    # Filters and modifiers
+    def eq(self, column: str, value: Any) -> "FakeQuery":
+        self._filters.append(lambda r: r.get(column) == value)
+        return self
+
+    def in_(self, column: str, values: list) -> "FakeQuery":
+        wanted = set(values)
+        self._filters.append(lambda r: r.get(column) in wanted)
+        return self
+
+    def contains(self, column: str, values: list) -> "FakeQuery":
+        wanted = set(values)
+        self._filters.append(lambda r: wanted <= set(r.get(column) or ()))
+        return self
+
+    def order(self, column: str, desc: bool = False) -> "FakeQuery":
+        self._order.append((column, desc))
+        return self
+
+    def limit(self, size: int) -> "FakeQuery":
+        self._limit = size
+        return self
+
+    def range(self, start: int, end: int) -> "FakeQuery":
+        self._offset, self._limit = start, end - start + 1
+        return self
+
+    def execute(self) -> FakeResponse:
+        self._db.round_trip()
+        with self._db.lock:
+            return getattr(self, f"_execute_{self._op}")()
+
+    def _matching(self) -> list[dict]:
+        return [r for r in self._db.rows(self._table) if all(f(r) for f in self._filters)]
+
+    def _execute_select(self) -> FakeResponse:
+        rows = self._matching()
+        for column, desc in reversed(self._order):
+            rows.sort(key=lambda r: (r.get(column) is None, r.get(column) or ""), reverse=desc)
+        total = len(rows)
+        end = None if self._limit is None else self._offset + self._limit
+        rows = rows[self._offset:end]
+        data = [self._db.render(self._table, r, self._columns) for r in rows]
+        return FakeResponse(data, total if self._count else None)
+
+    def _execute_insert(self) -> FakeResponse:
+        payload = self._payload if isinstance(self._payload, list) else [self._payload]
+        inserted = []
+        for item in payload:
+            existing = None
+            if self._on_conflict:
+                key = item.get(self._on_conflict)
+                existing = next((r for r in self._db.tables[self._table] if r.get(self._on_conflict) == key), None)
+            if existing is not None:
+                existing.update(copy.deepcopy(item))
+                inserted.append(copy.deepcopy(existing))
+                continue
+            row = {k: make() for k, make in TABLE_DEFAULTS.get(self._table, {}).items()}
+            row.update(copy.deepcopy(item))
+            self._db.tables[self._table].append(row)
+            inserted.append(copy.deepcopy(row))
+        return FakeResponse(inserted)
+
+    def _execute_update(self) -> FakeResponse:
+        rows = self._matching()
+        for r in rows:
+            r.update(copy.deepcopy(self._payload))
+        return FakeResponse([copy.deepcopy(r) for r in rows])
+
+    def _execute_delete(self) -> FakeResponse:
+        rows = self._matching()
+        self._db.remove(self._table, rows)
+        return FakeResponse([copy.deepcopy(r) for r in rows])
+
+
+def _search(rows: list[dict], fields: list[str], prefix_fields: list[str], q: str, limit: int, offset: int, order: str) -> dict:
+    # Substring matching with prefix matches ranked first; no fuzzy matching
+    term = q.strip().lower()
+    hits = []
+    for row in rows:
+        values = {f: str(row.get(f) or "").lower() for f in fields}
+        if not any(term in v for v in values.values()):
+            continue
+        hits.append({**row, "rank": float(any(values[f].startswith(term) for f in prefix_fields))})
+    hits.sort(key=lambda r: (-r["rank"], r[order], r["id"]))
+    return {"results": hits[offset:offset + limit], "total": len(hits)}
+
+
+class FakeRPC:
+    def __init__(self, db: "FakeSupabase", name: str, params: dict):
+        self._db = db
+        self._name = name
+        self._params = params
+        self.path = f"/rpc/{name}"
+        self.http_method = "POST"
+
+    def execute(self) -> FakeResponse:
+        self._db.round_trip()
+        with self._db.lock:
+            return FakeResponse(getattr(self._db, f"_rpc_{self._name}")(**self._params))
+
+
+class FakeSupabase:
+    """In-memory replacement for `supabase.Client` with simulated latency."""
+
+    def __init__(self, latency_ms: float = 0.0, jitter_ms: float = 0.0, seed: Optional[int] = None):
+        self.tables: dict[str, list[dict]] = defaultdict(list)
+        self.lock = threading.Lock()
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.queries = 0
+        self._rng = random.Random(seed)
+
+    def table(self, name: str) -> FakeQuery:
+        return FakeQuery(self, name)
+
+    def rpc(self, name: str, params: dict) -> FakeRPC:
+        return FakeRPC(self, name, params)
+
+    def rows(self, table: str) -> list[dict]:
+        view = getattr(self, f"_view_{table}", None)
+        return view() if view else self.tables[table]
+
+    # Stand-ins for the SQL views in migrations.sql
+    def _view_team_checkin_summary(self) -> list[dict]:
+        latest: dict[str, dict] = {}
+        counts: dict[str, int] = defaultdict(int)
+        for c in self.tables["checkins"]:
+            counts[c["team_id"]] += 1
+            current = latest.get(c["team_id"])
+            if current is None or (c["created_at"], c["id"]) > (current["created_at"], current["id"]):
+                latest[c["team_id"]] = c
+        return [{**c, "checkin_count": counts[tid]} for tid, c in sorted(latest.items())]
+
+    # Stand-ins for the SQL functions in migrations.sql
+    def _rpc_search_users(self, q: str, max_results: int = 20, skip: int = 0) -> dict:
+        rows = [{k: u.get(k) for k in ("id", "name", "email", "picture")} for u in self.tables["users"]]
+        return _search(rows, ["name", "email"], ["name", "email"], q, max_results, skip, order="name")
+
+    def _rpc_checkin_history(self, team: str, max_results: int = 50, before_created_at: Optional[str] = None, before_id: Optional[str] = None) -> list[dict]:
+        rows = [c for c in self.tables["checkins"] if c["team_id"] == team]
+        if before_created_at is not None:
+            rows = [c for c in rows if (c["created_at"], c["id"]) < (before_created_at, before_id)]
+        rows.sort(key=lambda c: (c["created_at"], c["id"]), reverse=True)
+        return copy.deepcopy(rows[:max_results])
+
+    def _rpc_refresh_team_views(self, team_ids: Optional[list[str]] = None, for_event: Optional[str] = None) -> list[dict]:
+        # Runs under self.lock, so refreshes are serialized like the row locks in SQL
+        users = {u["id"]: u for u in self.tables["users"]}
+        events = {e["id"]: e for e in self.tables["events"]}
+        refreshed = []
+        for t in self.tables["teams"]:
+            if (team_ids is not None and t["id"] not in team_ids) or (for_event is not None and t["event_id"] != for_event):
+                continue
+            if t["event_id"] not in events or t["captain_id"] not in users:
+                continue
+            members = [users[m["user_id"]] for m in self.tables["team_members"] if m["team_id"] == t["id"] and m["user_id"] in users]
+            view = {
+                "team_id": t["id"],
+                "user_ids": [t["captain_id"]] + [u["id"] for u in members],
+                "document": copy.deepcopy({
+                    "id": t["id"],
+                    "event": events[t["event_id"]],
+                    "teamNumber": t["team_number"],
+                    "conference": t["conference"],
+                    "captain": users[t["captain_id"]],
+                    "members": members,
+                    "checkInDate": t.get("check_in_date"),
+                }),
+                "updated_at": _now(),
+            }
+            existing = next((v for v in self.tables["team_views"] if v["team_id"] == t["id"]), None)
+            if existing is not None:
+                existing.update(view)
+            else:
+                self.tables["team_views"].append(view)
+            refreshed.append(copy.deepcopy(view))
+        return refreshed
+
+    def _rpc_search_teams(self, q: str, max_results: int = 20, skip: int = 0) -> dict:
+        events = {e["id"]: e for e in self.tables["events"]}
+        rows = [{
+            "id": t["id"],
+            "team_number": t["team_number"],
+            "conference": t["conference"],
+            "event_id": t["event_id"],
+            "event_title": events[t["event_id"]]["title"],
+        } for t in self.tables["teams"] if t["event_id"] in events]
+        fields = ["team_number", "conference", "event_title"]
+        return _search(rows, fields, ["team_number", "event_title"], q, max_results, skip, order="team_number")
+
+    def round_trip(self) -> None:
+        with self.lock:
+            self.queries += 1
+            delay = self.latency_ms + self._rng.uniform(0, self.jitter_ms)
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+    def render(self, table: str, row: dict, columns: str) -> dict:
+        out: dict[str, Any] = {}
+        for item in _split_top_level(columns):
+            if item == "*":
+                out.update(copy.deepcopy(row))
+                continue
+            match = _EMBED_RE.match(item)
+            if not match:
+                out[item] = copy.deepcopy(row.get(item))
+                continue
+            alias, target, _hint, sub = match.groups()
+            local, remote, many = RELATIONS[(table, target)]
+            related = [r for r in self.tables[target] if r.get(remote) == row.get(local)]
+            rendered = [self.render(target, r, sub) for r in related]
+            out[alias or target] = rendered if many else (rendered[0] if rendered else None)
+        return out
+
+    def remove(self, table: str, rows: list[dict]) -> None:
+        ids = {id(r) for r in rows}
+        self.tables[table] = [r for r in self.tables[table] if id(r) not in ids]
+        for child, child_col, parent_col in CASCADES.get(table, []):
+            keys = {r.get(parent_col) for r in rows}
+            doomed = [r for r in self.tables[child] if r.get(child_col) in keys]
+            if doomed:
+                self.remove(child, doomed)
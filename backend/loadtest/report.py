@@ -0,0 +1,106 @@
+import bisect
+import math
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list (0.0 if empty)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+@dataclass
+class Sample:
+    endpoint: str
+    start: float
+    end: float
+    ok: bool
+
+    @property
+    def latency_ms(self) -> float:
+        return (self.end - self.start) * 1000
+
+
+@dataclass
+class Recorder:
+    """Collects request samples and event-loop lag measurements for one run."""
+
+    samples: list[Sample] = field(default_factory=list)
+    # (monotonic time, lag in ms) from the loop lag monitor, in time order
+    lag: list[tuple[float, float]] = field(default_factory=list)
+
+    def add(self, endpoint: str, start: float, end: float, ok: bool) -> None:
+        self.samples.append(Sample(endpoint, start, end, ok))
+
+    def max_lag_between(self, start: float, end: float) -> float:
+        times = [t for t, _ in self.lag]
+        lo = bisect.bisect_left(times, start)
+        hi = bisect.bisect_right(times, end)
+        return max((lag for _, lag in self.lag[lo:hi]), default=0.0)
+
+
+@dataclass
+class EndpointStats:
+    endpoint: str
+    requests: int
+    errors: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    lag_p95_ms: float
+    lag_max_ms: float
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.requests if self.requests else 0.0
+
+
+def summarize(recorder: Recorder) -> list[EndpointStats]:
+    """Per-endpoint latency percentiles, error counts and the worst event-loop
+    lag observed while each request was in flight."""
+    by_endpoint: dict[str, list[Sample]] = {}
+    for s in recorder.samples:
+        by_endpoint.setdefault(s.endpoint, []).append(s)
+
+    stats = []
+    for endpoint, samples in by_endpoint.items():
+        latencies = sorted(s.latency_ms for s in samples)
+        lags = sorted(recorder.max_lag_between(s.start, s.end) for s in samples)
+        stats.append(EndpointStats(
+            endpoint=endpoint,
+            requests=len(samples),
+            errors=sum(not s.ok for s in samples),
+            p50_ms=percentile(latencies, 50),
+            p95_ms=percentile(latencies, 95),
+            p99_ms=percentile(latencies, 99),
+            max_ms=latencies[-1],
+            lag_p95_ms=percentile(lags, 95),
+            lag_max_ms=lags[-1],
+        ))
+    return stats
+
+
+def format_report(stats: list[EndpointStats], recorder: Recorder, duration_s: float, db_queries: Optional[int] = None) -> str:
+    header = f"{'endpoint':<34}{'reqs':>7}{'err%':>7}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}{'lag p95':>9}{'lag max':>9}"
+    lines = [header, "-" * len(header)]
+    for s in stats:
+        lines.append(
+            f"{s.endpoint:<34}{s.requests:>7}{s.error_rate * 100:>6.1f}%"
+            f"{s.p50_ms:>9.1f}{s.p95_ms:>9.1f}{s.p99_ms:>9.1f}{s.max_ms:>9.1f}"
+            f"{s.lag_p95_ms:>9.1f}{s.lag_max_ms:>9.1f}"
+        )
+    lags = sorted(lag for _, lag in recorder.lag)
+    total = len(recorder.samples)
+    lines.append("")
+    lines.append(f"requests: {total} in {duration_s:.1f}s ({total / duration_s if duration_s else 0:.1f} req/s); latencies in ms")
+    lines.append(
+        f"event-loop lag: p50 {percentile(lags, 50):.1f} ms, p99 {percentile(lags, 99):.1f} ms, "
+        f"max {lags[-1] if lags else 0.0:.1f} ms"
+    )
+    if db_queries is not None:
+        lines.append(f"database queries: {db_queries}")
+    return "\n".join(lines)
@@ -0,0 +1,194 @@
+import asyncio
+import os
+import random
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import httpx
+
+from loadtest.fake_supabase import FakeSupabase
+from loadtest.report import Recorder
+
+# database.py builds a real client at import time; give it something to build
+os.environ.setdefault("SUPABASE_URL", "http://supabase.loadtest.invalid")
+os.environ.setdefault("SUPABASE_ANON_KEY", "loadtest.anon.key")
+
+import database  # noqa: E402
+import link_checks  # noqa: E402
+import routes.auth as auth_routes  # noqa: E402
+from main import app  # noqa: E402
+from models.user import GoogleUserInfo  # noqa: E402
+
+
+@dataclass
+class ScenarioConfig:
+    users: int = 300
+    teams: int = 100
+    events: int = 40
+    window_s: float = 60.0  # arrivals are spread over this window (Poisson)
+    rate: Optional[float] = None  # arrivals per second; overrides window_s
+    think_ms: float = 500.0  # mean pause between a user's requests
+    checkins_per_user: int = 1
+    db_latency_ms: float = 20.0
+    db_jitter_ms: float = 10.0
+    oauth_latency_ms: float = 150.0
+    link_latency_ms: float = 80.0  # check-in link validation, per fetch
+    lag_interval_ms: float = 20.0
+    seed: int = 2025
+
+
+def seed_database(db: FakeSupabase, cfg: ScenarioConfig) -> None:
+    """Fill the stand-in with events, whitelisted users and teams.
+
+    Users are dealt round-robin onto teams; the first user dealt to a team is its captain.
+    """
+    for e in range(cfg.events):
+        db.tables["events"].append({
+            "id": f"event-{e}",
+            "title": f"Event {e:02d}",
+            "theme": None,
+            "full_theme_url": None,
+            "description": "Load test event",
+            "category": "Design",
+            "team_size": "1-6",
+            "types": ["Team"],
+            "rubric_url": "https://example.com/rubric.pdf",
+        })
+    members: dict[int, list[str]] = {t: [] for t in range(cfg.teams)}
+    for u in range(cfg.users):
+        user = {
+            "id": f"user-{u}",
+            "email": f"student{u}@ncssm.edu",
+            "name": f"Student {u}",
+            "picture": f"https://example.com/avatar/{u}.png",
+            "google_id": f"google-{u}",
+            "created_at": "2025-01-01T00:00:00",
+            "updated_at": "2025-01-01T00:00:00",
+        }
+        db.tables["users"].append(user)
+        db.tables["whitelist"].append({"email": user["email"], "added_at": "2025-01-01T00:00:00"})
+        if cfg.teams:
+            members[u % cfg.teams].append(user["id"])
+    for t, user_ids in members.items():
+        if not user_ids:
+            continue
+        db.tables["teams"].append({
+            "id": f"team-{t}",
+            "event_id": f"event-{t % max(cfg.events, 1)}",
+            "team_number": f"2045-{t:03d}",
+            "conference": "NCTSA States",
+            "captain_id": user_ids[0],
+            "check_in_date": "2025-04-01T09:00:00",
+        })
+        for uid in user_ids[1:]:
+            db.tables["team_members"].append({"team_id": f"team-{t}", "user_id": uid})
+
+
+def install_fakes(cfg: ScenarioConfig) -> FakeSupabase:
+    """Point database.py at an in-memory Supabase and stub the Google OAuth calls
+    and the check-in link fetcher.
+
+    The login code `code-<n>` signs in as seeded user n.
+    """
+    db = FakeSupabase(cfg.db_latency_ms, cfg.db_jitter_ms, seed=cfg.seed)
+    seed_database(db, cfg)
+    database.supabase = db
+
+    async def exchange_code_for_token(code: str) -> dict:
+        await asyncio.sleep(cfg.oauth_latency_ms / 1000)
+        return {"access_token": code}
+
+    async def get_google_user_info(access_token: str) -> GoogleUserInfo:
+        await asyncio.sleep(cfg.oauth_latency_ms / 1000)
+        n = access_token.split("-", 1)[1]
+        return GoogleUserInfo(id=f"google-{n}", email=f"student{n}@ncssm.edu", name=f"Student {n}", picture=f"https://example.com/avatar/{n}.png")
+
+    async def fetch_link(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(cfg.link_latency_ms / 1000)
+        return httpx.Response(200)
+
+    auth_routes.exchange_code_for_token = exchange_code_for_token
+    link_checks.set_fetcher(link_checks.HttpxFetcher(transport=httpx.MockTransport(fetch_link), block_private=False))
+    auth_routes.get_google_user_info = get_google_user_info
+    return db
+
+
+async def monitor_loop_lag(recorder: Recorder, interval_ms: float, stop: asyncio.Event) -> None:
+    interval = interval_ms / 1000
+    while not stop.is_set():
+        expected = time.monotonic() + interval
+        await asyncio.sleep(interval)
+        now = time.monotonic()
+        recorder.lag.append((now, max(0.0, (now - expected) * 1000)))
+
+
+async def _timed(recorder: Recorder, endpoint: str, request) -> Optional[httpx.Response]:
+    start = time.monotonic()
+    try:
+        response = await request
+    except Exception:
+        recorder.add(endpoint, start, time.monotonic(), False)
+        return None
+    recorder.add(endpoint, start, time.monotonic(), response.status_code < 400)
+    return response
+
+
+async def student_journey(client: httpx.AsyncClient, n: int, cfg: ScenarioConfig, recorder: Recorder, rng: random.Random) -> None:
+    """Log in, load the portal's team list, then submit check-ins."""
+    r = await _timed(recorder, "GET /auth/callback", client.get(
+        "/auth/callback", params={"code": f"code-{n}", "state": "loadtest"}
+    ))
+    location = r.headers.get("location", "") if r is not None else ""
+    if "access_token=" not in location:
+        return
+    headers = {"Authorization": f"Bearer {location.split('access_token=', 1)[1]}"}
+
+    await asyncio.sleep(rng.expovariate(1000 / cfg.think_ms) if cfg.think_ms else 0)
+    r = await _timed(recorder, "GET /teams/me", client.get("/teams/me", headers=headers))
+    teams = r.json() if r is not None and r.status_code == 200 else []
+    if not teams:
+        return
+
+    team_id = teams[0]["id"]
+    for c in range(cfg.checkins_per_user):
+        await asyncio.sleep(rng.expovariate(1000 / cfg.think_ms) if cfg.think_ms else 0)
+        await _timed(recorder, "POST /teams/{team_id}/checkins", client.post(
+            f"/teams/{team_id}/checkins",
+            headers=headers,
+            json={"links": [f"https://docs.google.com/document/d/loadtest-{n}-{c}"]},
+        ))
+
+
+async def run_scenario(cfg: ScenarioConfig) -> tuple[Recorder, float, FakeSupabase]:
+    """Replay the competition-day mix against the app in-process.
+
+    Returns the recorder, the wall-clock duration and the stand-in database.
+    """
+    db = install_fakes(cfg)
+    # Fill the team read model like POST /teams/views/rebuild does after migrating
+    await database.rebuild_team_views()
+    db.queries = 0
+    recorder = Recorder()
+    rng = random.Random(cfg.seed)
+    rate = cfg.rate or (cfg.users / cfg.window_s if cfg.window_s else float("inf"))
+
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(monitor_loop_lag(recorder, cfg.lag_interval_ms, stop))
+    transport = httpx.ASGITransport(app=app)
+    started = time.monotonic()
+    async with httpx.AsyncClient(transport=transport, base_url="http://loadtest") as client:
+
+        async def arrive(n: int, at: float) -> None:
+            await asyncio.sleep(max(0.0, at - (time.monotonic() - started)))
+            await student_journey(client, n, cfg, recorder, random.Random(cfg.seed + n))
+
+        offsets, at = [], 0.0
+        for _ in range(cfg.users):
+            at += rng.expovariate(rate) if rate != float("inf") else 0.0
+            offsets.append(at)
+        await asyncio.gather(*(arrive(n, offset) for n, offset in enumerate(offsets)))
+    duration = time.monotonic() - started
+    stop.set()
+    await monitor
+    return recorder, duration, db
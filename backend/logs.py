@@ -0,0 +1,185 @@
+import atexit
+import copy
+import json
+import logging
+import os
+import queue
+import random
+import sys
+import threading
+import time
+from contextvars import ContextVar
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Structured, non-blocking logging. Records are put on a bounded queue from the
+# event loop and written as JSON lines by a background thread; when the queue is
+# full they are dropped (and counted) instead of blocking the request.
+
+# Config
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+# Fraction of DEBUG/INFO records kept; warnings and errors are never sampled
+LOG_SAMPLE_RATE = float(os.getenv("LOG_SAMPLE_RATE", "1.0"))
+# At most LOG_RATE_LIMIT warnings/errors per message per LOG_RATE_WINDOW_S
+LOG_RATE_LIMIT = int(os.getenv("LOG_RATE_LIMIT", "20"))
+LOG_RATE_WINDOW_S = float(os.getenv("LOG_RATE_WINDOW_S", "60"))
+
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+_STANDARD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.utcfromtimestamp(record.created).isoformat() + "Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        # Everything passed through `extra=` (request_id, table, operation, duration_ms, ...)
+        for key, value in vars(record).items():
+            if key not in _STANDARD_ATTRS and value is not None:
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class ContextFilter(logging.Filter):
+    """Stamp the current request id on the record before it leaves the request's context."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if getattr(record, "request_id", None) is None:
+            record.request_id = request_id_var.get()
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= logging.WARNING or self.rate >= 1.0 or random.random() < self.rate
+
+
+class RateLimitFilter(logging.Filter):
+    """Let through at most `limit` warnings/errors per (logger, message) per window.
+
+    The first record after a suppressed stretch carries a `suppressed` count.
+    """
+
+    def __init__(self, limit: int, window_s: float):
+        super().__init__()
+        self.limit = limit
+        self.window_s = window_s
+        self._lock = threading.Lock()
+        # key -> [window start, emitted in window, suppressed since last emit]
+        self._windows: dict[tuple[str, str], list] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < logging.WARNING or self.limit <= 0:
+            return True
+        key = (record.name, str(record.msg))
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= self.window_s:
+                suppressed = window[2] if window else 0
+                window = self._windows[key] = [now, 0, 0]
+            else:
+                suppressed = 0
+            if window[1] >= self.limit:
+                window[2] += 1
+                return False
+            window[1] += 1
+            suppressed += window[2]
+            window[2] = 0
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler that never blocks: records are dropped when the queue is full."""
+
+    def __init__(self, q: "queue.Queue[logging.LogRecord]"):
+        super().__init__(q)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Resolve the message and traceback now, in the caller's thread, but keep
+        # the extra fields for the JSON formatter
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.dropped:
+            record.dropped = self.dropped
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            return
+        self.dropped = 0
+
+
+_listener: Optional[QueueListener] = None
+_handler: Optional[DroppingQueueHandler] = None
+_setup_lock = threading.Lock()
+
+
+def setup_logging() -> None:
+    """Attach the queue handler to the `tsahub` logger and start the writer thread. Idempotent."""
+    global _listener, _handler
+    with _setup_lock:
+        if _listener is not None:
+            return
+        q: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        _handler = DroppingQueueHandler(q)
+        _handler.addFilter(SamplingFilter(LOG_SAMPLE_RATE))
+        _handler.addFilter(RateLimitFilter(LOG_RATE_LIMIT, LOG_RATE_WINDOW_S))
+        _handler.addFilter(ContextFilter())
+
+        stream = logging.StreamHandler(sys.stdout)
+        stream.setFormatter(JsonFormatter())
+        _listener = QueueListener(q, stream, respect_handler_level=False)
+        _listener.start()
+        atexit.register(shutdown_logging)
+
+        root = logging.getLogger("tsahub")
+        root.setLevel(LOG_LEVEL)
+        root.addHandler(_handler)
+        root.propagate = False
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the writer thread."""
+    global _listener
+    with _setup_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+
+
+def get_logger(name: str) -> logging.Logger:
+    setup_logging()
+    return logging.getLogger(f"tsahub.{name}")
+
+
+def dropped_records() -> int:
+    return _handler.dropped if _handler else 0
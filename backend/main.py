@@ -1,11 +1,26 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Depends, Request
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.staticfiles import StaticFiles
+import asyncio
+import os
+import uuid
 from datetime import datetime
 
 from routes.auth import router as auth_router
 from routes.events import router as event_router
 from routes.teams import router as team_router
 from routes.checkins import router as checkin_router
+from routes.search import router as search_router
+from singleflight import get_metrics as get_single_flight_metrics
+from cache import get_backend
+from snapshots import SNAPSHOT_DIR
+from logs import request_id_var, shutdown_logging
+from resilience import response_state_var
+from utils import verify_admin_jwt, load_revocations
+import database
+import readiness
+import link_checks
 
 app = FastAPI(title="Google OAuth 2 API", version="1.0.0")
 
@@ -24,13 +39,81 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Pagination cursor for GET /teams/{team_id}/checkins
+    expose_headers=["X-Next-Cursor"],
 )
 
+@app.middleware("http")
+async def request_context(request: Request, call_next):
+    # Request id for structured logs; reuse the caller's if it sent one
+    request_id = request.headers.get("X-Request-ID") or uuid.uuid4().hex
+    state: dict = {}
+    token = request_id_var.set(request_id)
+    state_token = response_state_var.set(state)
+    try:
+        response = await call_next(request)
+    finally:
+        response_state_var.reset(state_token)
+        request_id_var.reset(token)
+    response.headers["X-Request-ID"] = request_id
+    if state.get("stale"):
+        # Served from the last good result while Supabase is failing
+        response.headers["X-Data-Stale"] = "true"
+        response.headers["Warning"] = '110 - "Response is Stale"'
+    return response
+
+
 # Register routers
 app.include_router(auth_router)
 app.include_router(event_router)
 app.include_router(team_router)
 app.include_router(checkin_router)
+app.include_router(search_router)
+
+# Published event catalog snapshots (see snapshots.py)
+os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+app.mount("/snapshots", StaticFiles(directory=SNAPSHOT_DIR), name="snapshots")
+
+
+@app.on_event("startup")
+async def start_cache():
+    # Subscribes to cross-worker invalidations when a shared cache is configured
+    await get_backend().start()
+    await load_revocations()
+
+
+_startup_tasks: list[asyncio.Task] = []
+
+
+@app.on_event("startup")
+async def publish_catalog_snapshot():
+    # A fresh host has no snapshot until the first event write; publish one
+    # without holding up startup (a no-op when the catalog is unchanged)
+    _startup_tasks.append(asyncio.create_task(database.publish_event_catalog()))
+
+
+@app.on_event("startup")
+async def backfill_team_views():
+    # Teams without a team_views row are invisible to reads; fill them once per start
+    _startup_tasks.append(asyncio.create_task(database.backfill_team_views()))
+
+
+@app.on_event("startup")
+async def start_readiness_probes():
+    readiness.start()
+
+
+@app.on_event("startup")
+async def start_link_checks():
+    link_checks.start()
+
+
+@app.on_event("shutdown")
+async def close_cache():
+    await readiness.stop()
+    await link_checks.stop()
+    await get_backend().close()
+    shutdown_logging()
 
 
 @app.get("/")
@@ -43,6 +126,22 @@ async def health_check():
     return {"status": "healthy", "timestamp": datetime.utcnow().isoformat()}
 
 
+@app.get("/ready")
+async def readiness_check():
+    """Readiness for the load balancer: 503 while Supabase or the event loop is unhealthy.
+
+    Served from cached background probe results (see readiness.py).
+    """
+    ready, payload = readiness.report()
+    return JSONResponse(payload, status_code=200 if ready else 503)
+
+
+@app.get("/metrics/single-flight")
+async def single_flight_metrics(admin: None = Depends(verify_admin_jwt)):
+    """Admin-only: per-function counters for coalesced database reads."""
+    return get_single_flight_metrics()
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -65,3 +65,180 @@ CREATE TABLE IF NOT EXISTS checkins (
 );
 
 CREATE INDEX IF NOT EXISTS idx_checkins_team_id ON checkins(team_id);
+
+-- Per-link validation results, written in the background after a checkin is stored
+ALTER TABLE checkins ADD COLUMN IF NOT EXISTS link_checks jsonb NOT NULL DEFAULT '[]'::jsonb;
+
+-- Denormalized team read model: one document per team, shaped like the Team API
+-- model and rewritten by the team, event and user write paths in database.py.
+-- The API writes views for teams that have none at startup; POST /teams/views/rebuild
+-- rewrites them all.
+CREATE TABLE IF NOT EXISTS team_views (
+    team_id UUID PRIMARY KEY REFERENCES teams(id) ON DELETE CASCADE,
+    user_ids UUID[] NOT NULL,
+    document JSONB NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_team_views_user_ids ON team_views USING GIN (user_ids);
+
+-- Rebuild the views of the given teams (or of one event's teams; all teams when
+-- both are NULL) and return them. The teams rows are locked before anything is
+-- read, so refreshes of the same team run one at a time and each reads every
+-- write committed before it: a slower refresh can't overwrite a newer document.
+-- Keys match the Team API model (models/team.py).
+CREATE OR REPLACE FUNCTION refresh_team_views(team_ids uuid[] DEFAULT NULL, for_event text DEFAULT NULL)
+RETURNS SETOF team_views
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    PERFORM 1 FROM teams t
+    WHERE (team_ids IS NULL OR t.id = ANY(team_ids)) AND (for_event IS NULL OR t.event_id = for_event)
+    ORDER BY t.id
+    FOR UPDATE;
+
+    -- A new statement, so a new snapshot: it sees writes committed while waiting for the locks
+    RETURN QUERY
+    INSERT INTO team_views AS v (team_id, user_ids, document, updated_at)
+    SELECT t.id,
+           ARRAY[t.captain_id] || coalesce(m.user_ids, '{}'),
+           jsonb_build_object(
+               'id', t.id,
+               'event', to_jsonb(e),
+               'teamNumber', t.team_number,
+               'conference', t.conference,
+               'captain', to_jsonb(c),
+               'members', coalesce(m.members, '[]'::jsonb),
+               'checkInDate', t.check_in_date
+           ),
+           now()
+    FROM teams t
+    JOIN events e ON e.id = t.event_id
+    JOIN users c ON c.id = t.captain_id
+    LEFT JOIN LATERAL (
+        SELECT array_agg(u.id) AS user_ids, jsonb_agg(to_jsonb(u)) AS members
+        FROM team_members tm
+        JOIN users u ON u.id = tm.user_id
+        WHERE tm.team_id = t.id
+    ) m ON true
+    WHERE (team_ids IS NULL OR t.id = ANY(team_ids)) AND (for_event IS NULL OR t.event_id = for_event)
+    ON CONFLICT (team_id) DO UPDATE
+        SET user_ids = EXCLUDED.user_ids, document = EXCLUDED.document, updated_at = EXCLUDED.updated_at
+    RETURNING v.*;
+END;
+$$;
+
+-- Admin search (GET /search/users, GET /search/teams). Trigram indexes serve the
+-- substring (LIKE '%q%'), prefix and fuzzy word matches; results are ranked with
+-- prefix matches first, then by trigram word similarity.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_users_name_trgm ON users USING GIN (lower(name) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_users_email_trgm ON users USING GIN (lower(email) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_teams_team_number_trgm ON teams USING GIN (lower(team_number) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_teams_conference_trgm ON teams USING GIN (lower(conference) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_events_title_trgm ON events USING GIN (lower(title) gin_trgm_ops);
+
+-- Escape LIKE wildcards so the search term is matched literally
+CREATE OR REPLACE FUNCTION like_escape(s text) RETURNS text
+LANGUAGE sql IMMUTABLE
+AS $$ SELECT replace(replace(replace(s, '\', '\\'), '%', '\%'), '_', '\_') $$;
+
+-- Both return {"results": [...one page...], "total": <matches across all pages>},
+-- so the total is still reported for an offset past the last match.
+DROP FUNCTION IF EXISTS search_users(text, int, int);
+DROP FUNCTION IF EXISTS search_teams(text, int, int);
+
+CREATE OR REPLACE FUNCTION search_users(q text, max_results int DEFAULT 20, skip int DEFAULT 0)
+RETURNS json
+LANGUAGE sql STABLE
+AS $$
+    WITH matches AS (
+        SELECT u.id, u.name, u.email, u.picture,
+               (CASE WHEN lower(u.name) LIKE like_escape(lower(trim(q))) || '%'
+                       OR lower(u.email) LIKE like_escape(lower(trim(q))) || '%' THEN 1 ELSE 0 END
+                + greatest(word_similarity(lower(trim(q)), lower(u.name)),
+                           word_similarity(lower(trim(q)), lower(u.email))))::real AS rank
+        FROM users u
+        -- Single table: the planner ORs the trigram index scans (BitmapOr)
+        WHERE lower(u.name) LIKE '%' || like_escape(lower(trim(q))) || '%'
+           OR lower(u.email) LIKE '%' || like_escape(lower(trim(q))) || '%'
+           OR lower(trim(q)) <% lower(u.name)
+    ),
+    page AS (
+        SELECT * FROM matches m
+        ORDER BY m.rank DESC, m.name, m.id
+        LIMIT max_results OFFSET skip
+    )
+    SELECT json_build_object(
+        'results', coalesce((SELECT json_agg(p ORDER BY p.rank DESC, p.name, p.id) FROM page p), '[]'::json),
+        'total', (SELECT count(*) FROM matches)
+    );
+$$;
+
+CREATE OR REPLACE FUNCTION search_teams(q text, max_results int DEFAULT 20, skip int DEFAULT 0)
+RETURNS json
+LANGUAGE sql STABLE
+AS $$
+    -- Candidates come from one trigram index match per table; OR-ing teams and
+    -- events columns across the join can't use either table's index
+    WITH candidates AS (
+        SELECT t.id FROM teams t
+        WHERE lower(t.team_number) LIKE '%' || like_escape(lower(trim(q))) || '%'
+           OR lower(t.conference) LIKE '%' || like_escape(lower(trim(q))) || '%'
+        UNION
+        SELECT t.id FROM events e
+        JOIN teams t ON t.event_id = e.id
+        WHERE lower(e.title) LIKE '%' || like_escape(lower(trim(q))) || '%'
+           OR lower(trim(q)) <% lower(e.title)
+    ),
+    matches AS (
+        SELECT t.id, t.team_number, t.conference, e.id AS event_id, e.title AS event_title,
+               (CASE WHEN lower(t.team_number) LIKE like_escape(lower(trim(q))) || '%'
+                       OR lower(e.title) LIKE like_escape(lower(trim(q))) || '%' THEN 1 ELSE 0 END
+                + greatest(
+                    word_similarity(lower(trim(q)), lower(t.team_number)),
+                    word_similarity(lower(trim(q)), lower(e.title)),
+                    word_similarity(lower(trim(q)), lower(t.conference))
+                ))::real AS rank
+        FROM candidates c
+        JOIN teams t ON t.id = c.id
+        JOIN events e ON e.id = t.event_id
+    ),
+    page AS (
+        SELECT * FROM matches m
+        ORDER BY m.rank DESC, m.team_number, m.id
+        LIMIT max_results OFFSET skip
+    )
+    SELECT json_build_object(
+        'results', coalesce((SELECT json_agg(p ORDER BY p.rank DESC, p.team_number, p.id) FROM page p), '[]'::json),
+        'total', (SELECT count(*) FROM matches)
+    );
+$$;
+
+-- Check-in history: keyset pages newest first, and each team's latest check-in
+CREATE INDEX IF NOT EXISTS idx_checkins_team_created ON checkins(team_id, created_at DESC, id DESC);
+
+CREATE OR REPLACE FUNCTION checkin_history(
+    team uuid,
+    max_results int DEFAULT 50,
+    before_created_at timestamptz DEFAULT NULL,
+    before_id uuid DEFAULT NULL
+)
+RETURNS SETOF checkins
+LANGUAGE sql STABLE
+AS $$
+    SELECT c.*
+    FROM checkins c
+    WHERE c.team_id = team
+      AND (before_created_at IS NULL OR (c.created_at, c.id) < (before_created_at, before_id))
+    ORDER BY c.created_at DESC, c.id DESC
+    LIMIT max_results;
+$$;
+
+CREATE OR REPLACE VIEW team_checkin_summary AS
+SELECT DISTINCT ON (c.team_id)
+    c.*,
+    count(*) OVER (PARTITION BY c.team_id) AS checkin_count
+FROM checkins c
+ORDER BY c.team_id, c.created_at DESC, c.id DESC;
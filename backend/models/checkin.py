@@ -7,9 +7,46 @@ class CheckinCreate(BaseModel):
     links: List[str]
 
 
+class LinkCheck(BaseModel):
+    url: str  # normalized
+    # pending, ok, private (sign-in required), broken (404/410), error, unreachable or invalid
+    status: str = "pending"
+    http_status: Optional[int] = None
+    error: Optional[str] = None
+    checked_at: Optional[datetime] = None
+
+
 class Checkin(BaseModel):
     id: str
     team_id: str
     submitted_at: datetime
     links: List[str]
     created_at: datetime
+    # One entry per link, in order; empty until the background check has run
+    link_checks: List[LinkCheck] = []
+
+
+class CheckinImport(BaseModel):
+    team_id: str
+    links: List[str]
+    # Original submission time when backfilling; defaults to now
+    submitted_at: Optional[datetime] = None
+
+
+class CheckinBulkCreate(BaseModel):
+    checkins: List[CheckinImport]
+
+
+class CheckinPage(BaseModel):
+    checkins: List[Checkin]
+    next_cursor: Optional[str] = None  # pass as `before` for the next (older) page
+
+    def __bool__(self) -> bool:
+        # Empty pages are falsy so @cached skips them like other empty results
+        return bool(self.checkins)
+
+
+class CheckinSummary(BaseModel):
+    team_id: str
+    checkin_count: int
+    latest: Checkin
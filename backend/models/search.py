@@ -0,0 +1,31 @@
+from typing import Generic, List, Optional, TypeVar
+from pydantic import BaseModel, Field
+
+T = TypeVar("T")
+
+
+class UserSearchResult(BaseModel):
+    id: str
+    name: str
+    email: str
+    picture: Optional[str] = None
+    rank: float
+
+
+class TeamSearchResult(BaseModel):
+    id: str
+    team_number: str = Field(..., alias="teamNumber")
+    conference: str
+    event_id: str = Field(..., alias="eventId")
+    event_title: str = Field(..., alias="eventTitle")
+    rank: float
+
+    class Config:
+        populate_by_name = True
+
+
+class SearchPage(BaseModel, Generic[T]):
+    results: List[T]
+    total: int  # matches across all pages
+    limit: int
+    offset: int
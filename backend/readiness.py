@@ -0,0 +1,109 @@
+import asyncio
+import os
+import time
+from collections import deque
+from datetime import datetime
+from typing import Optional
+
+from dotenv import load_dotenv
+
+import database
+from logs import get_logger
+
+load_dotenv()
+
+# Deep readiness for GET /ready. Probes run in the background on a fixed interval
+# and the endpoint only reads their last results, so however often the load
+# balancer polls, each worker issues at most one probe query per interval.
+
+# Config
+READY_PROBE_INTERVAL_S = float(os.getenv("READY_PROBE_INTERVAL_S", "5"))
+READY_DB_TIMEOUT_S = float(os.getenv("READY_DB_TIMEOUT_S", "2"))
+READY_DB_LATENCY_MS = float(os.getenv("READY_DB_LATENCY_MS", "1000"))
+READY_LOOP_LAG_MS = float(os.getenv("READY_LOOP_LAG_MS", "250"))
+READY_LAG_SAMPLE_MS = float(os.getenv("READY_LAG_SAMPLE_MS", "100"))
+
+logger = get_logger("readiness")
+
+_state: dict = {"supabase": None, "checked_at": None}
+_lag_samples: deque = deque(maxlen=max(1, int(READY_PROBE_INTERVAL_S * 1000 / READY_LAG_SAMPLE_MS)))
+_tasks: list[asyncio.Task] = []
+
+
+def _now() -> str:
+    return datetime.utcnow().isoformat()
+
+
+async def _probe_supabase() -> dict:
+    result = {"threshold_ms": READY_DB_LATENCY_MS, "circuit": database.breaker.snapshot()}
+    try:
+        latency_ms = await database.ping(READY_DB_TIMEOUT_S)
+    except asyncio.TimeoutError:
+        return {**result, "status": "fail", "latency_ms": None, "error": f"timed out after {READY_DB_TIMEOUT_S}s"}
+    except Exception as e:
+        return {**result, "status": "fail", "latency_ms": None, "error": str(e)}
+    status = "ok" if latency_ms <= READY_DB_LATENCY_MS and result["circuit"]["state"] == "closed" else "fail"
+    return {**result, "status": status, "latency_ms": round(latency_ms, 1)}
+
+
+async def _probe_loop() -> None:
+    while True:
+        result = await _probe_supabase()
+        previous = _state["supabase"]
+        if result["status"] == "fail" and (previous is None or previous["status"] == "ok"):
+            logger.warning("Readiness probe failing", extra={"dependency": "supabase", "error": result.get("error"), "latency_ms": result["latency_ms"]})
+        elif result["status"] == "ok" and previous is not None and previous["status"] == "fail":
+            logger.info("Readiness probe recovered", extra={"dependency": "supabase", "latency_ms": result["latency_ms"]})
+        _state["supabase"] = result
+        _state["checked_at"] = time.monotonic()
+        await asyncio.sleep(READY_PROBE_INTERVAL_S)
+
+
+async def _lag_loop() -> None:
+    # How late a short sleep wakes up is how long the loop was blocked
+    interval = READY_LAG_SAMPLE_MS / 1000
+    while True:
+        expected = time.monotonic() + interval
+        await asyncio.sleep(interval)
+        _lag_samples.append(max(0.0, (time.monotonic() - expected) * 1000))
+
+
+def start() -> None:
+    if not _tasks:
+        _tasks.extend([asyncio.create_task(_probe_loop()), asyncio.create_task(_lag_loop())])
+
+
+async def stop() -> None:
+    for task in _tasks:
+        task.cancel()
+    await asyncio.gather(*_tasks, return_exceptions=True)
+    _tasks.clear()
+
+
+def report() -> tuple[bool, dict]:
+    """Last probe results as (ready, payload).
+
+    Not ready until the first probe completes, when any dependency breaches its
+    threshold, or when the last probe is older than three intervals (the probe
+    itself is stuck).
+    """
+    supabase = _state["supabase"]
+    checked_at: Optional[float] = _state["checked_at"]
+    if supabase is None:
+        supabase = {"status": "fail", "latency_ms": None, "error": "no probe has completed yet"}
+    else:
+        age_s = time.monotonic() - checked_at
+        supabase = {**supabase, "age_s": round(age_s, 1)}
+        if age_s > 3 * READY_PROBE_INTERVAL_S + READY_DB_TIMEOUT_S:
+            supabase.update(status="fail", error="probe result is stale")
+
+    lag_ms = max(_lag_samples, default=0.0)
+    event_loop = {
+        "status": "ok" if lag_ms <= READY_LOOP_LAG_MS else "fail",
+        "lag_ms": round(lag_ms, 1),
+        "threshold_ms": READY_LOOP_LAG_MS,
+    }
+
+    checks = {"supabase": supabase, "event_loop": event_loop}
+    ready = all(c["status"] == "ok" for c in checks.values())
+    return ready, {"status": "ready" if ready else "not_ready", "timestamp": _now(), "checks": checks}
@@ -0,0 +1,175 @@
+import asyncio
+import os
+import random
+import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from dotenv import load_dotenv
+from fastapi import HTTPException
+
+from logs import get_logger
+
+load_dotenv()
+
+logger = get_logger("resilience")
+
+# Config
+SUPABASE_READ_TIMEOUT_S = float(os.getenv("SUPABASE_READ_TIMEOUT_S", "5"))
+SUPABASE_WRITE_TIMEOUT_S = float(os.getenv("SUPABASE_WRITE_TIMEOUT_S", "10"))
+SUPABASE_READ_RETRIES = int(os.getenv("SUPABASE_READ_RETRIES", "2"))
+SUPABASE_RETRY_BASE_MS = float(os.getenv("SUPABASE_RETRY_BASE_MS", "100"))
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("BREAKER_FAILURE_THRESHOLD", "5"))
+BREAKER_RESET_S = float(os.getenv("BREAKER_RESET_S", "15"))
+LAST_GOOD_MAX_ENTRIES = int(os.getenv("LAST_GOOD_MAX_ENTRIES", "2000"))
+
+T = TypeVar("T")
+
+# Per-request mutable state set up by the middleware in main.py. Request handlers
+# run in a copy of the middleware's context, so they mutate this dict rather than
+# setting the variable.
+response_state_var: ContextVar[Optional[dict]] = ContextVar("response_state", default=None)
+
+
+class DatabaseUnavailable(Exception):
+    """Supabase could not answer: the breaker is open, the deadline passed or the failure was transient."""
+
+
+class CircuitOpenError(DatabaseUnavailable):
+    """Raised without calling Supabase while the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    closed: calls go through. After `failure_threshold` consecutive transient
+    failures it opens and fails fast for `reset_s`, then lets a single trial
+    call through (half-open); its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(self, failure_threshold: int = BREAKER_FAILURE_THRESHOLD, reset_s: float = BREAKER_RESET_S):
+        self.failure_threshold = failure_threshold
+        self.reset_s = reset_s
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+        # Supabase calls complete in worker threads as well as on the loop
+        self._lock = threading.Lock()
+
+    def before_call(self) -> None:
+        with self._lock:
+            if self.state == "closed":
+                return
+            if self.state == "open" and time.monotonic() - self.opened_at >= self.reset_s:
+                self.state = "half_open"
+            if self.state == "half_open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return
+            raise CircuitOpenError("Supabase circuit breaker is open")
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.state != "closed":
+                logger.info("Circuit breaker closed")
+            self.state = "closed"
+            self.failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                if self.state != "open":
+                    logger.warning("Circuit breaker opened", extra={"failures": self.failures})
+                self.state = "open"
+                self.opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """End a call that neither succeeded nor failed transiently."""
+        with self._lock:
+            if self.state == "half_open":
+                self._trial_in_flight = False
+
+    def snapshot(self) -> dict:
+        return {"state": self.state, "consecutive_failures": self.failures}
+
+
+async def call_with_deadline(
+    call: Callable[[], T],
+    *,
+    idempotent: bool,
+    breaker: CircuitBreaker,
+    is_transient: Callable[[Exception], bool],
+) -> T:
+    """Run a blocking call in a worker thread under the breaker and a total deadline.
+
+    Idempotent calls are retried on transient errors with full-jitter exponential
+    backoff for as long as the deadline allows. A call abandoned at its deadline
+    keeps its worker thread until the HTTP client's own timeout fires.
+    """
+    timeout_s = SUPABASE_READ_TIMEOUT_S if idempotent else SUPABASE_WRITE_TIMEOUT_S
+    retries = SUPABASE_READ_RETRIES if idempotent else 0
+    deadline = time.monotonic() + timeout_s
+    attempt = 0
+    while True:
+        breaker.before_call()
+        try:
+            result = await asyncio.wait_for(asyncio.to_thread(call), max(0.0, deadline - time.monotonic()))
+        except Exception as e:
+            if not isinstance(e, asyncio.TimeoutError) and not is_transient(e):
+                breaker.release()
+                raise
+            breaker.record_failure()
+            backoff = random.uniform(0, SUPABASE_RETRY_BASE_MS * 2 ** attempt) / 1000
+            if attempt >= retries or time.monotonic() + backoff >= deadline:
+                raise
+            attempt += 1
+            await asyncio.sleep(backoff)
+            continue
+        breaker.record_success()
+        return result
+
+
+def mark_stale() -> None:
+    state = response_state_var.get()
+    if state is not None:
+        state["stale"] = True
+
+
+_last_good: "OrderedDict[tuple, Any]" = OrderedDict()
+
+
+def last_good(fn: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """Degraded mode for a read function that raises on database errors.
+
+    Successful results are remembered per arguments. When the database is
+    unavailable (DatabaseUnavailable) the last good result is returned and the
+    response is marked stale; with nothing to fall back on the request fails
+    with 503 instead of looking like empty data. Any other error propagates.
+    Apply it outermost so every caller of a coalesced read marks its own response.
+    """
+    name = fn.__name__
+
+    @wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        key = (name, args, tuple(sorted(kwargs.items())))
+        try:
+            result = await fn(*args, **kwargs)
+        except DatabaseUnavailable as e:
+            if key in _last_good:
+                logger.warning("Serving stale result", extra={"function": name, "error": str(e)})
+                mark_stale()
+                return _last_good[key]
+            raise HTTPException(status_code=503, detail="Database temporarily unavailable")
+        _last_good[key] = result
+        _last_good.move_to_end(key)
+        while len(_last_good) > LAST_GOOD_MAX_ENTRIES:
+            _last_good.popitem(last=False)
+        return result
+
+    return wrapper
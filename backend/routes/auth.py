@@ -1,9 +1,10 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Header
 from fastapi.responses import RedirectResponse
 import secrets
 import httpx
 from dotenv import load_dotenv
 from pydantic import BaseModel
+from typing import Optional
 
 from models.user import User, GoogleUserInfo
 from database import (
@@ -17,12 +18,15 @@ from database import (
     remove_whitelist_email,
     list_users,
 )
-from utils import create_access_token, verify_token, verify_admin_password, create_admin_token, verify_admin_jwt
+from logs import get_logger
+from utils import create_access_token, verify_token, verify_admin_password, create_admin_token, verify_admin_jwt, revoke_token
 
 import os
 
 load_dotenv()
 
+logger = get_logger("auth")
+
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 # Config
@@ -96,17 +100,21 @@ async def auth_callback(code: str, state: str):
     # Enforce whitelist membership via Supabase
     allowed = await is_email_whitelisted(google_user.email)
     if not allowed:
-        print(f"Unauthorized login attempt for: {google_user.email}")
+        logger.warning("Unauthorized login attempt", extra={"email": google_user.email})
         raise HTTPException(status_code=403, detail="Email not allowed")
 
     # Find or create user
     existing_user = await get_user_by_google_id(google_user.id)
-    if existing_user:
-        user = await update_user(existing_user.id, {
-            "name": google_user.name,
-            "email": google_user.email,
-            "picture": google_user.picture,
-        })
+    profile = {
+        "name": google_user.name,
+        "email": google_user.email,
+        "picture": google_user.picture,
+    }
+    if existing_user and all(getattr(existing_user, k) == v for k, v in profile.items()):
+        # Unchanged profile: skip the write so logins don't invalidate cached teams
+        user = existing_user
+    elif existing_user:
+        user = await update_user(existing_user.id, profile)
     else:
         user = await create_user({
             "email": google_user.email,
@@ -172,7 +180,16 @@ async def get_current_user(user_id: str = Depends(verify_token)):
     return user
 
 @router.post("/logout")
-async def logout():
-    # With header-based JWTs the client should discard the token locally.
-    # Server-side no-op for stateless JWTs (unless you implement revocation).
+async def logout(
+    authorization: Optional[str] = Header(None),
+    admin_token: Optional[str] = Header(None, alias="X-Admin-Token"),
+):
+    # The client should still discard the token locally; any token sent along
+    # is also revoked server-side until it expires.
+    if authorization:
+        parts = authorization.split()
+        if len(parts) == 2 and parts[0].lower() == "bearer":
+            await revoke_token(parts[1])
+    if admin_token:
+        await revoke_token(admin_token)
     return {"message": "Logged out successfully"}
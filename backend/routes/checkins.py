@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import List, Optional
 
-from utils import verify_token, verify_admin_jwt
-from models.checkin import CheckinCreate, Checkin
+from utils import verify_token, verify_admin_jwt, trusted_response
+from models.checkin import CheckinCreate, Checkin, CheckinBulkCreate, CheckinSummary
 import database
+import link_checks
 
 router = APIRouter()
 
@@ -28,12 +29,42 @@ async def create_checkin_endpoint(team_id: str, payload: CheckinCreate, user_id:
     if not await _user_is_on_team(user_id, team_id):
         raise HTTPException(status_code=403, detail="User not authorized to submit checkin for this team")
 
-    return await database.create_checkin(team_id, payload)
+    checkin = await database.create_checkin(team_id, payload)
+    # Links are validated in the background; results land in checkin.link_checks
+    link_checks.submit(checkin.id, checkin.links)
+    return checkin
 
 
+# Newest first, one page at a time. When there are older checkins the response
+# carries an X-Next-Cursor header; pass it back as `before` for the next page.
 @router.get("/teams/{team_id}/checkins", response_model=List[Checkin])
-async def list_team_checkins(team_id: str):
-    return await database.get_checkins_by_team(team_id)
+async def list_team_checkins(
+    team_id: str,
+    limit: int = Query(50, ge=1, le=200),
+    before: Optional[str] = None,
+):
+    page = await database.get_checkins_by_team(team_id, limit, before)
+    response = trusted_response(page.checkins, List[Checkin])
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    return response
+
+
+# Admin-only: import many checkins at once (backfills, migrating from another tool).
+# Imported links are not queued for background validation.
+@router.post("/checkins/bulk", response_model=List[Checkin])
+async def bulk_create_checkins(payload: CheckinBulkCreate, _=Depends(verify_admin_jwt)):
+    if not payload.checkins:
+        return []
+    if len(payload.checkins) > 5000:
+        raise HTTPException(status_code=413, detail="At most 5000 checkins per request")
+    return trusted_response(await database.create_checkins_bulk(payload.checkins), List[Checkin])
+
+
+# Admin-only: latest checkin and checkin count for every team that has checked in
+@router.get("/checkins/summary", response_model=List[CheckinSummary])
+async def checkin_summary(_=Depends(verify_admin_jwt)):
+    return trusted_response(await database.get_checkin_summaries(), List[CheckinSummary])
 
 
 @router.get("/checkins/{checkin_id}", response_model=Checkin)
@@ -41,7 +72,7 @@ async def get_checkin(checkin_id: str):
     c = await database.get_checkin_by_id(checkin_id)
     if not c:
         raise HTTPException(status_code=404, detail="Checkin not found")
-    return c
+    return trusted_response(c, Checkin)
 
 
 @router.delete("/checkins/{checkin_id}")
@@ -3,7 +3,8 @@ from typing import List
 
 from models.event import Event
 from database import create_event, get_event_by_id, list_events, update_event, delete_event
-from utils import verify_token, verify_admin_jwt
+from utils import verify_token, verify_admin_jwt, trusted_response
+from snapshots import read_manifest, manifest_with_url
 
 router = APIRouter(prefix="/events", tags=["events"])
 
@@ -11,12 +12,20 @@ router = APIRouter(prefix="/events", tags=["events"])
 async def add_event(event: Event, admin: None = Depends(verify_admin_jwt)):
     return await create_event(event.model_dump(exclude_unset=True))
 
+@router.get("/catalog/manifest")
+async def fetch_catalog_manifest():
+    """Current static snapshot of the event catalog; no database work."""
+    manifest = read_manifest()
+    if not manifest:
+        raise HTTPException(status_code=404, detail="Event catalog has not been published")
+    return manifest_with_url(manifest)
+
 @router.get("/{event_id}", response_model=Event)
 async def fetch_event(event_id: str):
     event = await get_event_by_id(event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
-    return event
+    return trusted_response(event, Event)
 
 
 @router.put("/{event_id}", response_model=Event)
@@ -33,4 +42,4 @@ async def delete_event_route(event_id: str, admin: None = Depends(verify_admin_j
 
 @router.get("/", response_model=List[Event])
 async def fetch_all_events():
-    return await list_events()
+    return trusted_response(await list_events(), List[Event])
@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Depends, Query
+
+from models.search import SearchPage, UserSearchResult, TeamSearchResult
+from database import search_users, search_teams
+from utils import verify_admin_jwt, trusted_response
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+
+# Admin pickers: ranked, paginated matches on name/email. An empty query lists everyone by name.
+@router.get("/users", response_model=SearchPage[UserSearchResult])
+async def search_users_route(
+    q: str = Query("", max_length=100),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    admin: None = Depends(verify_admin_jwt),
+):
+    return trusted_response(await search_users(q.strip(), limit, offset), SearchPage[UserSearchResult])
+
+
+# Matches on team number, event title and conference
+@router.get("/teams", response_model=SearchPage[TeamSearchResult])
+async def search_teams_route(
+    q: str = Query("", max_length=100),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    admin: None = Depends(verify_admin_jwt),
+):
+    return trusted_response(await search_teams(q.strip(), limit, offset), SearchPage[TeamSearchResult])
@@ -2,8 +2,8 @@ from fastapi import APIRouter, Depends, HTTPException
 from typing import List
 
 from models.team import Team
-from database import create_team, get_team_by_id, list_teams, list_user_teams, update_team, delete_team
-from utils import verify_token, verify_admin_jwt
+from database import create_team, get_team_by_id, list_teams, list_user_teams, update_team, delete_team, rebuild_team_views
+from utils import verify_token, verify_admin_jwt, trusted_response
 
 router = APIRouter(
     prefix="/teams",
@@ -19,13 +19,19 @@ async def create_team_route(team_data: dict, admin: None = Depends(verify_admin_
 # Get all teams
 @router.get("/", response_model=List[Team])
 async def list_teams_route():
-    return await list_teams()
+    return trusted_response(await list_teams(), List[Team])
 
 
 # Get teams for current user
 @router.get("/me", response_model=List[Team])
 async def list_my_teams_route(user_id: str = Depends(verify_token)):
-    return await list_user_teams(user_id)
+    return trusted_response(await list_user_teams(user_id), List[Team])
+
+
+# Rewrite the denormalized team_views read model (after the migration, or to repair it)
+@router.post("/views/rebuild")
+async def rebuild_team_views_route(admin: None = Depends(verify_admin_jwt)):
+    return {"rebuilt": await rebuild_team_views()}
 
 
 # Get team by id
@@ -34,7 +40,7 @@ async def get_team_route(team_id: str):
     team = await get_team_by_id(team_id)
     if not team:
         raise HTTPException(status_code=404, detail="Team not found")
-    return team
+    return trusted_response(team, Team)
 
 
 @router.put("/{team_id}", response_model=Team)
@@ -0,0 +1,69 @@
+import asyncio
+from functools import wraps
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+# Calls currently running, keyed by (function name, args, kwargs)
+_inflight: dict[Hashable, "asyncio.Task[Any]"] = {}
+# Per-function counters: calls, executions (actual queries), shared (joined an in-flight call), errors.
+# Keyed by name only, so the table stays bounded and never holds argument values (ids, emails).
+_metrics: dict[str, dict[str, int]] = {}
+
+
+def _consume_exception(task: "asyncio.Task[Any]") -> None:
+    # Avoid "exception was never retrieved" warnings when every caller was cancelled
+    if not task.cancelled():
+        task.exception()
+
+
+def single_flight(fn: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """Coalesce concurrent identical calls to an async read function.
+
+    Callers that arrive while a call with the same arguments is running await the
+    same task instead of issuing their own query. The shared task is shielded, so a
+    cancelled caller does not cancel the work for the others. Apply it below any
+    caching decorator so that cache misses are coalesced too.
+    """
+    name = fn.__name__
+
+    @wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        key = (name, args, tuple(sorted(kwargs.items())))
+        try:
+            task = _inflight.get(key)
+        except TypeError:
+            # Unhashable arguments can't be coalesced
+            return await fn(*args, **kwargs)
+
+        stats = _metrics.setdefault(name, {"calls": 0, "executions": 0, "shared": 0, "errors": 0})
+        stats["calls"] += 1
+        if task is not None:
+            stats["shared"] += 1
+        else:
+            stats["executions"] += 1
+            task = asyncio.ensure_future(fn(*args, **kwargs))
+            _inflight[key] = task
+            task.add_done_callback(lambda t: _inflight.pop(key, None))
+            task.add_done_callback(_consume_exception)
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            stats["errors"] += 1
+            raise
+
+    return wrapper
+
+
+def get_metrics() -> dict[str, Any]:
+    """Snapshot of per-function counters plus the number of calls currently in flight."""
+    return {
+        "in_flight": len(_inflight),
+        "functions": {name: dict(stats) for name, stats in _metrics.items()},
+    }
+
+
+def reset_metrics() -> None:
+    _metrics.clear()
@@ -0,0 +1,151 @@
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+from dotenv import load_dotenv
+
+from models.event import Event
+
+try:
+    import fcntl
+except ImportError:  # Windows: publishes are only serialized within one process
+    fcntl = None
+
+load_dotenv()
+
+# Static, content-hashed copies of the public event catalog. Each publish writes
+# events.<hash>.json (immutable) and repoints events.manifest.json at it, so the
+# public site can read the catalog from a CDN or the filesystem instead of
+# calling GET /events/ on every visit.
+SNAPSHOT_DIR = os.getenv("SNAPSHOT_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "snapshots"))
+# Public base URL the artifacts are served from (e.g. a CDN); defaults to the API's /snapshots mount
+SNAPSHOT_BASE_URL = os.getenv("SNAPSHOT_BASE_URL", "/snapshots")
+SNAPSHOT_KEEP = int(os.getenv("SNAPSHOT_KEEP", "5"))
+
+MANIFEST_NAME = "events.manifest.json"
+LOCK_NAME = ".publish.lock"
+
+_publish_lock = asyncio.Lock()
+
+
+def _manifest_path() -> str:
+    return os.path.join(SNAPSHOT_DIR, MANIFEST_NAME)
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    # Unique temp file per write, so concurrent writers never share one
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def read_manifest() -> Optional[dict]:
+    """The current manifest, or None if there is none or it can't be read (the next publish replaces it)."""
+    try:
+        with open(_manifest_path()) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or not isinstance(manifest.get("path"), str):
+        return None
+    return manifest
+
+
+def render_catalog(events: list[Event]) -> bytes:
+    """Canonical JSON for the catalog, shaped exactly like GET /events/."""
+    payload = [e.model_dump(mode="json", by_alias=True) for e in events]
+    return json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+
+
+def _prune(keep: str) -> None:
+    artifacts = [
+        os.path.join(SNAPSHOT_DIR, name)
+        for name in os.listdir(SNAPSHOT_DIR)
+        if name.startswith("events.") and name.endswith(".json") and name != MANIFEST_NAME
+    ]
+    artifacts.sort(key=os.path.getmtime, reverse=True)
+    for path in artifacts[SNAPSHOT_KEEP:]:
+        if os.path.basename(path) != keep:
+            os.remove(path)
+
+
+def publish_catalog_sync(events: list[Event]) -> dict:
+    """Write the catalog artifact and manifest; a no-op if the content is unchanged."""
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    body = render_catalog(events)
+    digest = hashlib.sha256(body).hexdigest()[:16]
+
+    current = read_manifest()
+    if current and current.get("hash") == digest and os.path.exists(os.path.join(SNAPSHOT_DIR, current["path"])):
+        return current
+
+    name = f"events.{digest}.json"
+    _write_atomic(os.path.join(SNAPSHOT_DIR, name), body)
+    manifest = {
+        "version": (current or {}).get("version", 0) + 1,
+        "hash": digest,
+        "path": name,
+        "count": len(events),
+        "generated_at": datetime.utcnow().isoformat(),
+    }
+    _write_atomic(_manifest_path(), json.dumps(manifest, indent=2).encode())
+    _prune(keep=name)
+    return manifest
+
+
+def _acquire_file_lock():
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    f = open(os.path.join(SNAPSHOT_DIR, LOCK_NAME), "a")
+    if fcntl is not None:
+        fcntl.flock(f, fcntl.LOCK_EX)
+    return f
+
+
+@asynccontextmanager
+async def _publishing() -> AsyncIterator[None]:
+    # One publish at a time in this process, and across workers sharing SNAPSHOT_DIR
+    async with _publish_lock:
+        lock_file = await asyncio.to_thread(_acquire_file_lock)
+        try:
+            yield
+        finally:
+            lock_file.close()  # releases the flock
+
+
+async def publish_event_catalog(load_events: Callable[[], Awaitable[list[Event]]]) -> dict:
+    """Publish the catalog from events read while holding the publish lock.
+
+    Reading inside the lock means a slow publish can't replace a newer catalog
+    with the events it read before another write landed.
+    """
+    async with _publishing():
+        events = await load_events()
+        return await asyncio.to_thread(publish_catalog_sync, events)
+
+
+def manifest_with_url(manifest: dict) -> dict:
+    return {**manifest, "url": f"{SNAPSHOT_BASE_URL.rstrip('/')}/{manifest['path']}"}
+
+
+if __name__ == "__main__":
+    # On-demand publish: python snapshots.py
+    import database
+
+    async def _main() -> None:
+        manifest = await publish_event_catalog(database.fetch_events)
+        print(json.dumps(manifest_with_url(manifest), indent=2))
+
+    asyncio.run(_main())
@@ -0,0 +1,108 @@
+from typing import Iterable, Optional
+
+from models.team import Team
+
+# In-memory user -> team ids index backing GET /teams/me.
+# The index is filled from a single teams query on first use and then kept
+# up to date by the team write functions in database.py. Hydrated Team
+# objects are kept alongside it so warm users are answered without a query.
+# Every write bumps a generation counter; reads that started before a write
+# pass their generation to put_team/mark_built and are not cached.
+
+_user_teams: dict[str, set[str]] = {}
+_team_users: dict[str, set[str]] = {}
+_teams: dict[str, Team] = {}
+_built = False
+_generation = 0
+
+
+def generation() -> int:
+    return _generation
+
+
+def _bump() -> None:
+    global _generation
+    _generation += 1
+
+
+def is_built() -> bool:
+    return _built
+
+
+def mark_built(read_generation: int) -> None:
+    global _built
+    if read_generation == _generation:
+        _built = True
+
+
+def reset() -> None:
+    """Drop everything; the next lookup rebuilds the index from the database."""
+    global _built
+    _bump()
+    _user_teams.clear()
+    _team_users.clear()
+    _teams.clear()
+    _built = False
+
+
+def set_team_users(team_id: str, user_ids: Iterable[str]) -> None:
+    """Record the captain and members of a team, replacing any previous entry."""
+    _bump()
+    _index_team(team_id, user_ids)
+
+
+def _index_team(team_id: str, user_ids: Iterable[str]) -> None:
+    _unindex_team(team_id)
+    users = {uid for uid in user_ids if uid}
+    _team_users[team_id] = users
+    for uid in users:
+        _user_teams.setdefault(uid, set()).add(team_id)
+
+
+def remove_team(team_id: str) -> None:
+    _bump()
+    _unindex_team(team_id)
+    _teams.pop(team_id, None)
+
+
+def _unindex_team(team_id: str) -> None:
+    for uid in _team_users.pop(team_id, set()):
+        ids = _user_teams.get(uid)
+        if ids is None:
+            continue
+        ids.discard(team_id)
+        if not ids:
+            del _user_teams[uid]
+
+
+def team_ids_for_user(user_id: str) -> Optional[set[str]]:
+    """Return the team ids for a user, or None if the index has not been built yet."""
+    if not _built:
+        return None
+    return set(_user_teams.get(user_id, ()))
+
+
+def put_team(team: Team, read_generation: int) -> None:
+    """Cache a hydrated team and refresh its index entry, unless a write happened since the read began."""
+    if not team.id or read_generation != _generation:
+        return
+    _teams[team.id] = team
+    _index_team(team.id, [team.captain.id] + [m.id for m in team.members])
+
+
+def get_cached_team(team_id: str) -> Optional[Team]:
+    return _teams.get(team_id)
+
+
+def drop_teams_with_event(event_id: str) -> None:
+    _bump()
+    for tid, team in list(_teams.items()):
+        if team.event and team.event.id == event_id:
+            del _teams[tid]
+
+
+def drop_teams_with_user(user_id: str) -> None:
+    """Forget hydrated teams that embed this user; the index entry stays valid."""
+    _bump()
+    for tid in _user_teams.get(user_id, set()):
+        _teams.pop(tid, None)
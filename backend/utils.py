@@ -1,14 +1,25 @@
 import os
 import secrets
+import hashlib
+import time
+import threading
 import jwt
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from fastapi import HTTPException, Header
+from fastapi import HTTPException, Header, Response
 from passlib.context import CryptContext
-from typing import Optional
+from typing import Any, Optional
+from functools import lru_cache
+from pydantic import TypeAdapter
 from dotenv import load_dotenv
 
+from cache import get_backend, invalidate, on_invalidate
+from logs import get_logger
+
 load_dotenv()
 
+logger = get_logger("utils")
+
 # Config
 JWT_SECRET = os.getenv("JWT_SECRET", secrets.token_urlsafe(32))
 JWT_ALGORITHM = "HS256"
@@ -16,6 +27,17 @@ JWT_EXPIRATION_HOURS = 24
 
 ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
 
+# Debug flag: re-validate every trusted_response against its response model
+STRICT_MODELS = os.getenv("STRICT_MODELS", "").lower() in ("1", "true", "yes")
+
+# Verified claims are cached per token digest until the token's `exp`
+TOKEN_CACHE_MAX_ENTRIES = int(os.getenv("TOKEN_CACHE_MAX_ENTRIES", "10000"))
+
+_claims_cache: "OrderedDict[str, dict]" = OrderedDict()
+_revoked_tokens: dict[str, float] = {}
+# Sync dependencies run in FastAPI's threadpool, so guard the shared state
+_token_lock = threading.Lock()
+
 
 def create_access_token(data: dict) -> str:
     """Create JWT access token"""
@@ -26,6 +48,97 @@ def create_access_token(data: dict) -> str:
     return encoded_jwt
 
 
+def _token_digest(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def _purge_revoked(now: float) -> None:
+    for digest, exp in list(_revoked_tokens.items()):
+        if exp <= now:
+            del _revoked_tokens[digest]
+
+
+def decode_token(token: str) -> dict:
+    """Decode and verify a JWT, reusing cached claims for tokens seen before.
+
+    Raises jwt.PyJWTError for invalid, expired or revoked tokens.
+    """
+    digest = _token_digest(token)
+    now = time.time()
+    with _token_lock:
+        if digest in _revoked_tokens:
+            raise jwt.InvalidTokenError("Token has been revoked")
+        claims = _claims_cache.get(digest)
+        if claims is not None:
+            if claims.get("exp", 0) > now:
+                _claims_cache.move_to_end(digest)
+                return claims
+            del _claims_cache[digest]
+
+    claims = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+    if "exp" in claims:
+        with _token_lock:
+            _claims_cache[digest] = claims
+            while len(_claims_cache) > TOKEN_CACHE_MAX_ENTRIES:
+                _claims_cache.popitem(last=False)
+    return claims
+
+
+def _mark_revoked(digest: str, exp: float) -> None:
+    with _token_lock:
+        _purge_revoked(time.time())
+        _revoked_tokens[digest] = exp
+        _claims_cache.pop(digest, None)
+
+
+def _on_remote_revocation(data: Optional[str]) -> None:
+    if data:
+        digest, exp = data.split(":")
+        _mark_revoked(digest, float(exp))
+
+
+# Tokens revoked through another worker's /auth/logout
+on_invalidate("tokens", _on_remote_revocation)
+
+REVOKED_SET = "revoked_tokens"
+
+
+async def load_revocations() -> None:
+    """Pick up tokens revoked before this worker started. Called at startup."""
+    try:
+        revoked = await get_backend().expiring_set_members(REVOKED_SET)
+    except Exception as e:
+        logger.error("Error loading revoked tokens", extra={"error": str(e)})
+        return
+    for digest, exp in revoked.items():
+        _mark_revoked(digest, exp)
+
+
+async def revoke_token(token: str) -> bool:
+    """Reject a token server-side until it expires.
+
+    With CACHE_BACKEND=redis the revocation is stored in Redis until the token's
+    `exp` and applies to every worker, including ones started later. With the
+    in-process backend it lives in this process only: other workers keep
+    accepting the token and a restart forgets it.
+
+    Returns False if the token is not valid.
+    """
+    try:
+        claims = decode_token(token)
+    except jwt.PyJWTError:
+        return False
+    digest = _token_digest(token)
+    exp = claims.get("exp", time.time() + JWT_EXPIRATION_HOURS * 3600)
+    _mark_revoked(digest, exp)
+    try:
+        await get_backend().expiring_set_add(REVOKED_SET, digest, exp)
+    except Exception as e:
+        logger.error("Error storing revoked token", extra={"error": str(e)})
+    await invalidate("tokens", data=f"{digest}:{exp}")
+    return True
+
+
 def verify_token(authorization: Optional[str] = Header(None)) -> str:
     """Verify JWT token from Authorization header (Bearer) and return user_id (sub).
     """
@@ -39,7 +152,7 @@ def verify_token(authorization: Optional[str] = Header(None)) -> str:
     token = parts[1]
 
     try:
-        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+        payload = decode_token(token)
         user_id: str = payload.get("sub")
         if not user_id:
             raise HTTPException(status_code=401, detail="Invalid token")
@@ -81,8 +194,29 @@ def verify_admin_jwt(token: Optional[str] = Header(None, alias="X-Admin-Token"))
     if not token:
         raise HTTPException(status_code=401, detail="Admin token required")
     try:
-        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+        payload = decode_token(token)
         if payload.get("role") != "admin":
             raise HTTPException(status_code=401, detail="Invalid admin token")
     except jwt.PyJWTError:
-        raise HTTPException(status_code=401, detail="Invalid or expired admin token")
\ No newline at end of file
+        raise HTTPException(status_code=401, detail="Invalid or expired admin token")
+
+
+# Response helpers
+@lru_cache(maxsize=None)
+def _response_adapter(annotation: Any) -> TypeAdapter:
+    return TypeAdapter(annotation)
+
+
+def trusted_response(value: Any, annotation: Any) -> Response:
+    """Serialize models built from database rows straight to JSON.
+
+    FastAPI would otherwise re-validate the return value against `response_model`,
+    dump it to Python objects and run it through json.dumps. The rows were already
+    validated once when the models were built, so this renders the same
+    by-alias JSON in one pydantic-core pass (see loadtest/bench_models.py).
+    With STRICT_MODELS set, the output is round-tripped through full validation first.
+    """
+    adapter = _response_adapter(annotation)
+    if STRICT_MODELS:
+        adapter.validate_python(adapter.dump_python(value, by_alias=True))
+    return Response(content=adapter.dump_json(value, by_alias=True), media_type="application/json")
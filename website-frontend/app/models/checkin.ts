@@ -2,10 +2,19 @@ export interface CheckinCreate {
   links: string[]; // client uses string URLs; backend will validate
 }
 
+export interface LinkCheck {
+  url: string; // normalized
+  status: 'pending' | 'ok' | 'private' | 'broken' | 'error' | 'unreachable' | 'invalid';
+  http_status: number | null;
+  error: string | null;
+  checked_at: string | null;
+}
+
 export interface Checkin {
   id: string;
   team_id: string;
   submitted_at: string; // ISO datetime
   links: string[];
   created_at: string;
+  link_checks?: LinkCheck[]; // one per link, empty until checked in the background
 }
@@ -0,0 +1,21 @@
+import type { User } from './user';
+
+export interface SearchPage<T> {
+  results: T[];
+  total: number; // matches across all pages
+  limit: number;
+  offset: number;
+}
+
+export interface UserSearchResult extends User {
+  rank: number;
+}
+
+export interface TeamSearchResult {
+  id: string;
+  teamNumber: string;
+  conference: string;
+  eventId: string;
+  eventTitle: string;
+  rank: number;
+}
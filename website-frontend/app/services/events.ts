@@ -1,8 +1,38 @@
 import { Event } from "../models/event";
 
 const API_BASE_URL = process.env.NEXT_PUBLIC_API_BASE_URL;
+// Where published event catalog snapshots live: a CDN, or "/snapshots" when the
+// build publishes into public/snapshots (SNAPSHOT_DIR=../website-frontend/public/snapshots
+// python snapshots.py). Unset, the site reads GET /events/ directly: going through the
+// API's own /snapshots mount would cost the backend two requests per visit instead of one.
+const EVENTS_SNAPSHOT_URL = process.env.NEXT_PUBLIC_EVENTS_SNAPSHOT_URL;
+
+interface CatalogManifest {
+  version: number;
+  hash: string;
+  path: string;
+  count: number;
+  generated_at: string;
+}
+
+async function fetchEventSnapshot(): Promise<Event[]> {
+  const manifestRes = await fetch(`${EVENTS_SNAPSHOT_URL}/events.manifest.json`, { cache: "no-cache" });
+  if (!manifestRes.ok) throw new Error(`Failed to fetch event manifest: ${manifestRes.status}`);
+  const manifest = (await manifestRes.json()) as CatalogManifest;
+  // Artifacts are content-hashed, so they can be cached indefinitely
+  const res = await fetch(`${EVENTS_SNAPSHOT_URL}/${manifest.path}`, { cache: "force-cache" });
+  if (!res.ok) throw new Error(`Failed to fetch event snapshot: ${res.status}`);
+  return (await res.json()) as Event[];
+}
 
 export async function fetchEvents(): Promise<Event[]> {
+  if (EVENTS_SNAPSHOT_URL) {
+    try {
+      return await fetchEventSnapshot();
+    } catch {
+      // No snapshot published yet (or unreachable); fall back to the live API
+    }
+  }
   const res = await fetch(`${API_BASE_URL}/events/`);
   if (!res.ok) throw new Error(`Failed to fetch events: ${res.status}`);
   const data = await res.json();
@@ -14,13 +14,21 @@ export async function fetchTeams(fetcher: Fetcher = fetch): Promise<Team[]> {
   return data as Team[];
 }
 
+// The full check-in history, newest first. The API pages it; follow X-Next-Cursor until the last page.
 export async function getTeamCheckins(teamId: string, fetcher: Fetcher = fetch): Promise<Checkin[]> {
-  const res = await fetcher(`${API_BASE}/teams/${teamId}/checkins`, {
-    method: "GET",
-  });
-  if (!res.ok) throw new Error(`Failed to fetch checkins (${res.status})`);
-  const data = await res.json();
-  return data as Checkin[];
+  const checkins: Checkin[] = [];
+  let before: string | null = null;
+  do {
+    const params = new URLSearchParams({ limit: "200" });
+    if (before) params.set("before", before);
+    const res = await fetcher(`${API_BASE}/teams/${teamId}/checkins?${params}`, {
+      method: "GET",
+    });
+    if (!res.ok) throw new Error(`Failed to fetch checkins (${res.status})`);
+    checkins.push(...((await res.json()) as Checkin[]));
+    before = res.headers.get("X-Next-Cursor");
+  } while (before);
+  return checkins;
 }
 
 export async function createCheckin(teamId: string, payload: CheckinCreate, fetcher: Fetcher = fetch): Promise<Checkin> {